@@ -15,7 +15,7 @@ from .launchd import (
 )
 from .menubar import run_menubar
 from .report_store import report_store_from_config
-from .scan_cycle import perform_scan
+from .scan_cycle import ScanInProgressError, perform_scan
 
 
 def _cmd_setup(args: argparse.Namespace) -> int:
@@ -41,7 +41,11 @@ def _cmd_setup(args: argparse.Namespace) -> int:
 
 def _cmd_scan(_: argparse.Namespace) -> int:
     config = ensure_config(interactive=True)
-    result = perform_scan(config, open_report=True)
+    try:
+        result = perform_scan(config, open_report=True)
+    except ScanInProgressError as exc:
+        print(f"Scan skipped: {exc}")
+        return 1
     if result.diff:
         print(format_diff_summary(result.diff))
     return 0
@@ -55,10 +59,8 @@ def _cmd_diff(_: argparse.Namespace) -> int:
         print("No reports found in reports folder.")
         return 1
     diff = compute_diff(reports)
-    store.write_diff(diff)
     summary = compute_update_summary(reports)
-    store.write_summary(summary)
-    store.write_combined_report(reports, summary, diff)
+    store.write_all(reports, summary, diff)
     print(format_diff_summary(diff))
     return 0
 
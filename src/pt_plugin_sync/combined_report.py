@@ -7,13 +7,10 @@ import shutil
 import subprocess
 from datetime import datetime, timezone
 
+from .report_naming import COMBINED_HTML_LATEST_FILENAME, COMBINED_JSON_LATEST_FILENAME
 from .update_report import _action_text, _format_version, _sort_updates
 
 
-COMBINED_HTML_LATEST_FILENAME = "report__latest.html"
-COMBINED_JSON_LATEST_FILENAME = "report__latest.json"
-
-
 def _version_label(plugin: dict) -> str:
     short_version = plugin.get("short_version") or "unknown"
     bundle_version = plugin.get("bundle_version") or "unknown"
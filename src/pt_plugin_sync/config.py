@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import functools
 import os
 import pathlib
 import socket
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Iterable
 
 try:
@@ -24,6 +25,13 @@ DEFAULT_DEBOUNCE_SECONDS = 15
 DEFAULT_HASH_BINARIES = False
 DEFAULT_AUTO_UPDATE_DOWNLOAD = False
 
+_CONFIG_CACHE: tuple[tuple[str, int, int], Config] | None = None
+
+
+@functools.lru_cache(maxsize=64)
+def _expanded_path(raw: str) -> pathlib.Path:
+    return pathlib.Path(os.path.expanduser(raw))
+
 
 @dataclass
 class Config:
@@ -42,10 +50,10 @@ class Config:
     auto_update_download: bool = DEFAULT_AUTO_UPDATE_DOWNLOAD
 
     def expanded_plugins_path(self) -> pathlib.Path:
-        return pathlib.Path(os.path.expanduser(self.plugins_path))
+        return _expanded_path(self.plugins_path)
 
     def expanded_reports_path(self) -> pathlib.Path:
-        return pathlib.Path(os.path.expanduser(self.reports_path))
+        return _expanded_path(self.reports_path)
 
 
 @dataclass
@@ -98,12 +106,24 @@ def default_config(machine_name: str | None = None) -> Config:
 
 
 def load_config() -> Config | None:
-    if not CONFIG_PATH.exists():
+    global _CONFIG_CACHE
+    try:
+        stat = os.stat(CONFIG_PATH)
+    except FileNotFoundError:
         return None
+    cache_key = (str(CONFIG_PATH), stat.st_mtime_ns, stat.st_size)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == cache_key:
+        return replace(_CONFIG_CACHE[1])
     if tomllib is None:
         raise RuntimeError("tomllib unavailable; use Python 3.11+")
     with CONFIG_PATH.open("rb") as handle:
         data = tomllib.load(handle)
+    config = _config_from_data(data)
+    _CONFIG_CACHE = (cache_key, config)
+    return replace(config)
+
+
+def _config_from_data(data: dict) -> Config:
     return Config(
         machine_name=str(data.get("machine_name", "")),
         plugins_path=str(data.get("plugins_path", "")),
@@ -128,11 +148,11 @@ def validate_config(config: Config) -> ConfigValidation:
     backend = (config.reports_backend or DEFAULT_REPORTS_BACKEND).strip().lower()
     if not config.machine_name.strip():
         errors.append("machine_name is required")
-    plugins_path = pathlib.Path(os.path.expanduser(config.plugins_path))
+    plugins_path = config.expanded_plugins_path()
     if not plugins_path.exists() or not plugins_path.is_dir():
         errors.append(f"plugins_path does not exist: {plugins_path}")
     if backend == "local":
-        reports_path = pathlib.Path(os.path.expanduser(config.reports_path))
+        reports_path = config.expanded_reports_path()
         if not reports_path.exists() or not reports_path.is_dir():
             errors.append(f"reports_path does not exist: {reports_path}")
     elif backend == "dropbox":
@@ -156,6 +176,8 @@ def validate_config(config: Config) -> ConfigValidation:
 
 
 def write_config(config: Config) -> None:
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     lines = [
         f"machine_name = {_toml_escape(config.machine_name)}",
@@ -6,7 +6,7 @@ from typing import Callable
 
 from .config import Config
 from .diffing import format_diff_summary
-from .scan_cycle import perform_scan
+from .scan_cycle import ScanInProgressError, perform_scan
 
 
 class DebouncedRunner:
@@ -20,10 +20,13 @@ class DebouncedRunner:
         with self._lock:
             if self._timer:
                 self._timer.cancel()
-            self._timer = threading.Timer(self._delay_seconds, self._action)
+            self._timer = self._make_timer()
             self._timer.daemon = True
             self._timer.start()
 
+    def _make_timer(self) -> threading.Timer:
+        return threading.Timer(self._delay_seconds, self._action)
+
     def cancel(self) -> None:
         with self._lock:
             if self._timer:
@@ -42,6 +45,8 @@ def _perform_scan(config: Config, scan_lock: threading.Lock, pending: dict) -> N
                 result = perform_scan(config, open_report=True)
                 if result.diff:
                     print(format_diff_summary(result.diff))
+            except ScanInProgressError as exc:
+                print(f"Scan skipped: {exc}")
             except Exception as exc:
                 print(f"Scan failed: {exc}")
             if not pending.get("scan"):
@@ -34,37 +34,56 @@ def _plugin_map(report: dict) -> dict[str, dict]:
     return mapping
 
 
+def _sample_plugins(plugin_maps: dict[str, dict[str, dict]]) -> dict[str, dict]:
+    samples: dict[str, dict] = {}
+    for mapping in plugin_maps.values():
+        for key, plugin in mapping.items():
+            samples.setdefault(key, plugin)
+    return samples
+
+
+def _version_columns(
+    plugin_maps: dict[str, dict[str, dict]],
+) -> dict[str, dict[str, tuple[str, str]]]:
+    return {
+        machine: {
+            key: (
+                plugin.get("short_version") or "unknown",
+                plugin.get("bundle_version") or "unknown",
+            )
+            for key, plugin in mapping.items()
+        }
+        for machine, mapping in plugin_maps.items()
+    }
+
+
 def compute_diff(reports: dict[str, dict]) -> dict:
     machines = sorted(reports.keys())
     plugin_maps = {machine: _plugin_map(report) for machine, report in reports.items()}
-    all_keys: set[str] = set()
-    for mapping in plugin_maps.values():
-        all_keys.update(mapping.keys())
+    samples = _sample_plugins(plugin_maps)
+    versions = _version_columns(plugin_maps)
+    all_keys = samples.keys()
 
     missing: dict[str, list[dict]] = {machine: [] for machine in machines}
     unknown_versions: dict[str, list[dict]] = {machine: [] for machine in machines}
     counts: dict[str, dict] = {}
 
     for machine, mapping in plugin_maps.items():
+        machine_versions = versions[machine]
         unknown_count = 0
         for key in all_keys:
             if key not in mapping:
-                sample_plugin = next(
-                    (m.get(key) for m in plugin_maps.values() if key in m),
-                    None,
-                )
+                sample_plugin = samples[key]
                 missing[machine].append(
                     {
                         "key": key,
-                        "bundle_name": sample_plugin.get("bundle_name") if sample_plugin else None,
-                        "bundle_id": sample_plugin.get("bundle_id") if sample_plugin else None,
+                        "bundle_name": sample_plugin.get("bundle_name"),
+                        "bundle_id": sample_plugin.get("bundle_id"),
                     }
                 )
                 continue
             plugin = mapping[key]
-            short_version = plugin.get("short_version") or "unknown"
-            bundle_version = plugin.get("bundle_version") or "unknown"
-            if short_version == "unknown" and bundle_version == "unknown":
+            if machine_versions[key] == ("unknown", "unknown"):
                 unknown_count += 1
                 unknown_versions[machine].append(
                     {
@@ -80,33 +99,25 @@ def compute_diff(reports: dict[str, dict]) -> dict:
 
     version_mismatches: list[dict] = []
     for key in sorted(all_keys):
-        versions_by_machine: dict[str, dict] = {}
-        for machine, mapping in plugin_maps.items():
-            plugin = mapping.get(key)
-            if not plugin:
-                continue
-            versions_by_machine[machine] = {
-                "short_version": plugin.get("short_version") or "unknown",
-                "bundle_version": plugin.get("bundle_version") or "unknown",
-            }
-        if len(versions_by_machine) <= 1:
-            continue
-        unique_versions = {
-            (data["short_version"], data["bundle_version"]) for data in versions_by_machine.values()
+        present = {
+            machine: machine_versions[key]
+            for machine, machine_versions in versions.items()
+            if key in machine_versions
         }
-        if len(unique_versions) > 1:
-            sample_plugin = next(
-                (mapping.get(key) for mapping in plugin_maps.values() if key in mapping),
-                None,
-            )
-            version_mismatches.append(
-                {
-                    "key": key,
-                    "bundle_name": sample_plugin.get("bundle_name") if sample_plugin else None,
-                    "bundle_id": sample_plugin.get("bundle_id") if sample_plugin else None,
-                    "versions": versions_by_machine,
-                }
-            )
+        if len(present) <= 1 or len(set(present.values())) <= 1:
+            continue
+        sample_plugin = samples[key]
+        version_mismatches.append(
+            {
+                "key": key,
+                "bundle_name": sample_plugin.get("bundle_name"),
+                "bundle_id": sample_plugin.get("bundle_id"),
+                "versions": {
+                    machine: {"short_version": short_version, "bundle_version": bundle_version}
+                    for machine, (short_version, bundle_version) in present.items()
+                },
+            }
+        )
 
     diff = {
         "generated_at": datetime.now(tz=timezone.utc).astimezone().isoformat(),
@@ -193,28 +204,23 @@ def _version_key(short_version: str, bundle_version: str) -> tuple[tuple[int, ob
 def compute_update_summary(reports: dict[str, dict]) -> dict:
     machines = sorted(reports.keys())
     plugin_maps = {machine: _plugin_map(report) for machine, report in reports.items()}
-    all_keys: set[str] = set()
-    for mapping in plugin_maps.values():
-        all_keys.update(mapping.keys())
+    samples = _sample_plugins(plugin_maps)
+    versions = _version_columns(plugin_maps)
+    all_keys = samples.keys()
 
     updates_by_machine: dict[str, list[dict]] = {machine: [] for machine in machines}
     updates_by_plugin: dict[str, dict] = {}
 
     for key in sorted(all_keys):
-        sample_plugin = next(
-            (mapping.get(key) for mapping in plugin_maps.values() if key in mapping),
-            None,
-        )
-        bundle_name = sample_plugin.get("bundle_name") if sample_plugin else None
-        bundle_id = sample_plugin.get("bundle_id") if sample_plugin else None
+        sample_plugin = samples[key]
+        bundle_name = sample_plugin.get("bundle_name")
+        bundle_id = sample_plugin.get("bundle_id")
 
         versions_by_machine: dict[str, dict] = {}
-        for machine, mapping in plugin_maps.items():
-            plugin = mapping.get(key)
-            if not plugin:
+        for machine, machine_versions in versions.items():
+            if key not in machine_versions:
                 continue
-            short_version = plugin.get("short_version") or "unknown"
-            bundle_version = plugin.get("bundle_version") or "unknown"
+            short_version, bundle_version = machine_versions[key]
             versions_by_machine[machine] = {
                 "short_version": short_version,
                 "bundle_version": bundle_version,
@@ -236,76 +242,44 @@ def compute_update_summary(reports: dict[str, dict]) -> dict:
         if best_machine is not None:
             best_version = versions_by_machine[best_machine]["label"]
 
+        key_updates: list[tuple[str, dict]] = []
         for machine in machines:
-            mapping = plugin_maps.get(machine, {})
-            plugin = mapping.get(key)
-            if not plugin:
-                updates_by_machine[machine].append(
-                    {
-                        "key": key,
-                        "bundle_name": bundle_name,
-                        "bundle_id": bundle_id,
-                        "current_version": None,
-                        "latest_version": best_version,
-                        "best_machine": best_machine,
-                        "reason": "missing",
-                    }
-                )
-                continue
             data = versions_by_machine.get(machine)
-            if not data:
-                continue
-            if data["version_key"] is None:
-                updates_by_machine[machine].append(
-                    {
-                        "key": key,
-                        "bundle_name": bundle_name,
-                        "bundle_id": bundle_id,
-                        "current_version": data["label"],
-                        "latest_version": best_version,
-                        "best_machine": best_machine,
-                        "reason": "unknown_version",
-                    }
-                )
+            if data is None:
+                reason, current_version = "missing", None
+            elif data["version_key"] is None:
+                reason, current_version = "unknown_version", data["label"]
+            elif best_key is not None and data["version_key"] < best_key:
+                reason, current_version = "outdated", data["label"]
+            else:
                 continue
-            if best_key is not None and data["version_key"] < best_key:
-                updates_by_machine[machine].append(
-                    {
-                        "key": key,
-                        "bundle_name": bundle_name,
-                        "bundle_id": bundle_id,
-                        "current_version": data["label"],
-                        "latest_version": best_version,
-                        "best_machine": best_machine,
-                        "reason": "outdated",
-                    }
-                )
-
-        for machine in machines:
-            machine_updates = updates_by_machine[machine]
-            if not machine_updates:
-                continue
-            matching = [update for update in machine_updates if update["key"] == key]
-            if not matching:
-                continue
-            entry = updates_by_plugin.setdefault(
-                key,
-                {
-                    "bundle_name": bundle_name,
-                    "bundle_id": bundle_id,
-                    "latest_version": best_version,
-                    "best_machine": best_machine,
-                    "machines": [],
-                },
-            )
-            for update in matching:
-                entry["machines"].append(
+            update = {
+                "key": key,
+                "bundle_name": bundle_name,
+                "bundle_id": bundle_id,
+                "current_version": current_version,
+                "latest_version": best_version,
+                "best_machine": best_machine,
+                "reason": reason,
+            }
+            updates_by_machine[machine].append(update)
+            key_updates.append((machine, update))
+
+        if key_updates:
+            updates_by_plugin[key] = {
+                "bundle_name": bundle_name,
+                "bundle_id": bundle_id,
+                "latest_version": best_version,
+                "best_machine": best_machine,
+                "machines": [
                     {
                         "machine": machine,
                         "current_version": update["current_version"],
                         "reason": update["reason"],
                     }
-                )
+                    for machine, update in key_updates
+                ],
+            }
 
     return {
         "generated_at": datetime.now(tz=timezone.utc).astimezone().isoformat(),
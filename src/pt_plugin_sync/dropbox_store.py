@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Iterable
 
 import dropbox
-from dropbox.files import WriteMode
+from dropbox.files import DeleteArg, DeleteBatchResult, WriteMode
 
 from .combined_report import COMBINED_HTML_LATEST_FILENAME, build_combined_report_payload
 from .config import Config
 from .report_naming import ARCHIVE_DIR_NAME, DIFF_FILENAME, SUMMARY_FILENAME, is_timestamped_report
 
+_DELETE_BATCH_LIMIT = 1000
+_DELETE_BATCH_POLL_ATTEMPTS = 60
+_DELETE_BATCH_POLL_SECONDS = 0.5
+_LIST_FOLDER_LIMIT = 2000
+
 
 def _normalize_dropbox_path(path: str) -> str:
     normalized = path.strip()
@@ -76,6 +82,11 @@ class DropboxReportStore:
         self._upload_text(latest_html, html_payload, overwrite=True)
         self._upload_text(latest_json, json_payload + "\n", overwrite=True)
 
+    def write_all(self, reports: dict[str, dict], summary: dict, diff: dict) -> None:
+        self.write_diff(diff)
+        self.write_summary(summary)
+        self.write_combined_report(reports, summary, diff)
+
     def load_latest_reports(self) -> dict[str, dict]:
         reports: dict[str, dict] = {}
         for entry in self._list_files_in(self.reports_path):
@@ -95,17 +106,44 @@ class DropboxReportStore:
         if prune_days <= 0:
             return
         cutoff = datetime.now(tz=timezone.utc) - timedelta(days=prune_days)
-        for entry in self._list_files_in(self.reports_path):
-            if not is_timestamped_report(entry.name):
-                continue
-            if entry.client_modified < cutoff:
-                self.client.files_delete_v2(entry.path_lower)
         archive_path = f"{self.reports_path}/{ARCHIVE_DIR_NAME}"
-        for entry in self._list_files_in(archive_path):
-            if not is_timestamped_report(entry.name):
-                continue
-            if entry.client_modified < cutoff:
-                self.client.files_delete_v2(entry.path_lower)
+        stale: list[DeleteArg] = []
+        for folder in (self.reports_path, archive_path):
+            for entry in self._list_files_in(folder):
+                if not is_timestamped_report(entry.name):
+                    continue
+                if entry.client_modified < cutoff:
+                    stale.append(DeleteArg(entry.path_lower))
+        failed: list[str] = []
+        for start in range(0, len(stale), _DELETE_BATCH_LIMIT):
+            failed.extend(self._delete_batch(stale[start : start + _DELETE_BATCH_LIMIT]))
+        if failed:
+            raise RuntimeError(f"Failed to delete Dropbox reports: {', '.join(failed)}")
+
+    def _delete_batch(self, entries: list[DeleteArg]) -> list[str]:
+        launch = self.client.files_delete_batch(entries)
+        if launch.is_complete():
+            result = launch.get_complete()
+        elif launch.is_async_job_id():
+            result = self._wait_for_delete_batch(launch.get_async_job_id())
+        else:
+            return [entry.path for entry in entries]
+        return [
+            entry.path
+            for entry, outcome in zip(entries, result.entries)
+            if outcome.is_failure()
+        ]
+
+    def _wait_for_delete_batch(self, job_id: str) -> DeleteBatchResult:
+        for _ in range(_DELETE_BATCH_POLL_ATTEMPTS):
+            status = self.client.files_delete_batch_check(job_id)
+            if status.is_complete():
+                return status.get_complete()
+            if not status.is_in_progress():
+                failure = status.get_failed() if status.is_failed() else "unknown status"
+                raise RuntimeError(f"Dropbox delete batch failed: {failure}")
+            time.sleep(_DELETE_BATCH_POLL_SECONDS)
+        raise RuntimeError("Timed out waiting for Dropbox delete batch to finish.")
 
     def _upload_text(self, name: str, payload: str, overwrite: bool) -> None:
         path = f"{self.reports_path}/{name}"
@@ -131,7 +169,7 @@ class DropboxReportStore:
         return self._download_text(path)
 
     def _list_files_in(self, path: str) -> Iterable[dropbox.files.FileMetadata]:
-        result = self.client.files_list_folder(path)
+        result = self.client.files_list_folder(path, limit=_LIST_FOLDER_LIMIT)
         for entry in result.entries:
             if isinstance(entry, dropbox.files.FileMetadata):
                 yield entry
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import importlib
 import pathlib
 import shutil
 import subprocess
 import threading
 import tempfile
 import sys
-import tempfile
+import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 import rumps
 
@@ -22,7 +26,6 @@ from .config import (
     validate_config,
     write_config,
 )
-from .daemon import DebouncedRunner
 from .launchd import (
     install_menubar_launchagent,
     is_menubar_launchagent_installed,
@@ -30,11 +33,13 @@ from .launchd import (
     uninstall_menubar_launchagent,
     LOG_DIR,
 )
-from .scan_cycle import perform_scan
-from .combined_report import COMBINED_HTML_LATEST_FILENAME
+from .report_naming import COMBINED_HTML_LATEST_FILENAME
 from .auto_update import find_app_bundle, install_update
 from .update_check import current_version, is_update_available, latest_release
 
+_OPEN_BIN = shutil.which("open")
+
+
 @dataclass
 class IconPaths:
     idle: str | None
@@ -42,9 +47,29 @@ class IconPaths:
     updates: str | None
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_icon(name: str) -> str | None:
+    try:
+        from importlib import resources
+
+        data = resources.files("pt_plugin_sync.resources").joinpath(name).read_bytes()
+    except Exception:
+        return None
+    digest = hashlib.sha1(data).hexdigest()[:16]
+    target = pathlib.Path(tempfile.gettempdir()) / f"pt_plugin_sync_{digest}_{name}"
+    if target.exists():
+        return str(target)
+    try:
+        with tempfile.NamedTemporaryFile(dir=target.parent, delete=False) as handle:
+            handle.write(data)
+        pathlib.Path(handle.name).replace(target)
+    except OSError:
+        return None
+    return str(target)
+
+
 class IconAssets:
     def __init__(self) -> None:
-        self._temp_dir = tempfile.TemporaryDirectory()
         self.paths = IconPaths(
             idle=self._write_resource("icons8-check-mark-50.png"),
             scanning=self._write_resource("icons8-sync-50.png"),
@@ -52,15 +77,15 @@ class IconAssets:
         )
 
     def _write_resource(self, name: str) -> str | None:
-        try:
-            from importlib import resources
+        return _resolve_icon(name)
+
 
-            data = resources.files("pt_plugin_sync.resources").joinpath(name).read_bytes()
+def _preload_startup_modules() -> None:
+    for name in ("watchdog.observers", f"{__package__}.settings_server"):
+        try:
+            importlib.import_module(name)
         except Exception:
-            return None
-        target = pathlib.Path(self._temp_dir.name) / name
-        target.write_bytes(data)
-        return str(target)
+            continue
 
 
 class MenuState:
@@ -79,11 +104,17 @@ class MenuBarApp(rumps.App):
     def __init__(self, config: Config) -> None:
         super().__init__("PT", quit_button=None)
         self.config = config
-        self._icon_assets = IconAssets()
+        startup = ThreadPoolExecutor(max_workers=2)
+        icon_assets = startup.submit(IconAssets)
+        startup.submit(_preload_startup_modules)
         self._state = MenuState.IDLE
+        self._applied_view: tuple[str, str, str | None] | None = None
         self._release_state = ReleaseState.UNKNOWN
-        self._scan_lock = threading.Lock()
-        self._pending_scan = False
+        self._scan_condition = threading.Condition()
+        self._scan_thread: threading.Thread | None = None
+        self._scans_stopped = False
+        self._next_scan_at = 0.0
+        self._requested_scan_at: float | None = None
         self._last_summary: dict | None = None
         self._last_update_count = 0
         self._last_report_path: pathlib.Path | None = None
@@ -91,8 +122,6 @@ class MenuBarApp(rumps.App):
         self._current_version = current_version()
         self._latest_release_version: str | None = None
         self._observer = None
-        self._debouncer: DebouncedRunner | None = None
-        self._timer: rumps.Timer | None = None
         self._settings_server = None
         self._report_temp_dir: tempfile.TemporaryDirectory | None = None
 
@@ -147,20 +176,57 @@ class MenuBarApp(rumps.App):
             self._quit_item,
         ]
 
+        self._icon_assets = icon_assets.result()
+        startup.shutdown(wait=False)
         self._apply_state(MenuState.IDLE)
         self._update_release_items()
         self._update_start_login_item()
         self._update_auto_update_item()
-        self._setup_timer()
+        self._setup_scheduler()
         self._setup_watcher()
         self._warn_if_invalid_config()
         self._start_update_check()
 
-    def _setup_timer(self) -> None:
-        if self._timer:
-            self._timer.stop()
-        self._timer = rumps.Timer(self._on_timer, self.config.scan_interval_seconds)
-        self._timer.start()
+    def _setup_scheduler(self) -> None:
+        with self._scan_condition:
+            self._next_scan_at = time.monotonic() + self.config.scan_interval_seconds
+            self._scan_condition.notify()
+        if self._scan_thread is None:
+            self._scan_thread = threading.Thread(target=self._scan_loop)
+            self._scan_thread.daemon = True
+            self._scan_thread.start()
+
+    def _stop_scheduler(self) -> None:
+        with self._scan_condition:
+            self._scans_stopped = True
+            self._scan_condition.notify()
+
+    def _request_scan(self, delay: float = 0.0) -> None:
+        now = time.monotonic()
+        with self._scan_condition:
+            if delay <= 0:
+                self._requested_scan_at = now
+            elif self._requested_scan_at is None or self._requested_scan_at > now:
+                self._requested_scan_at = now + delay
+            self._scan_condition.notify()
+
+    def _wait_for_scan(self) -> bool:
+        with self._scan_condition:
+            while not self._scans_stopped:
+                deadline = self._next_scan_at
+                if self._requested_scan_at is not None:
+                    deadline = min(deadline, self._requested_scan_at)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._requested_scan_at = None
+                    self._next_scan_at = time.monotonic() + self.config.scan_interval_seconds
+                    return True
+                self._scan_condition.wait(remaining)
+            return False
+
+    def _scan_loop(self) -> None:
+        while self._wait_for_scan():
+            self._scan_worker()
 
     def _setup_watcher(self) -> None:
         self._teardown_watcher()
@@ -172,10 +238,8 @@ class MenuBarApp(rumps.App):
 
             class Handler(FileSystemEventHandler):
                 def on_any_event(self, event):  # type: ignore[override]
-                    if outer._debouncer:
-                        outer._debouncer.trigger()
+                    outer._request_scan(outer.config.debounce_seconds)
 
-            self._debouncer = DebouncedRunner(self.config.debounce_seconds, self._on_scan)
             self._observer = Observer()
             self._observer.schedule(
                 Handler(), str(self.config.expanded_plugins_path()), recursive=False
@@ -183,32 +247,35 @@ class MenuBarApp(rumps.App):
             self._observer.start()
         except Exception:
             self._observer = None
-            self._debouncer = None
 
     def _teardown_watcher(self) -> None:
         if self._observer:
             self._observer.stop()
             self._observer.join(timeout=5)
             self._observer = None
-        if self._debouncer:
-            self._debouncer.cancel()
-            self._debouncer = None
 
     def _apply_state(self, state: str) -> None:
         self._state = state
         if state == MenuState.SCANNING:
-            self.title = "PT*"
-            self._status_item.title = "Status: Scanning"
-            icon = self._icon_assets.paths.scanning
+            view = ("PT*", "Status: Scanning", self._icon_assets.paths.scanning)
         elif state == MenuState.UPDATES:
-            self.title = "PT!"
-            self._status_item.title = f"Status: Updates ({self._last_update_count})"
-            icon = self._icon_assets.paths.updates
+            view = (
+                "PT!",
+                f"Status: Updates ({self._last_update_count})",
+                self._icon_assets.paths.updates,
+            )
         else:
-            self.title = "PT"
-            self._status_item.title = "Status: Idle"
-            icon = self._icon_assets.paths.idle
-        if icon:
+            view = ("PT", "Status: Idle", self._icon_assets.paths.idle)
+        previous = self._applied_view
+        if view == previous:
+            return
+        self._applied_view = view
+        title, status_title, icon = view
+        if previous is None or previous[0] != title:
+            self.title = title
+        if previous is None or previous[1] != status_title:
+            self._status_item.title = status_title
+        if icon and (previous is None or previous[2] != icon):
             self.icon = icon
             self.template = True
 
@@ -236,20 +303,14 @@ class MenuBarApp(rumps.App):
     def _update_auto_update_item(self) -> None:
         self._auto_update_item.state = 1 if self.config.auto_update_download else 0
 
-    def _on_timer(self, _timer: rumps.Timer) -> None:
-        self._on_scan()
-
     def _on_scan(self, _sender=None) -> None:
-        if not self._scan_lock.acquire(blocking=False):
-            self._pending_scan = True
-            return
-        thread = threading.Thread(target=self._scan_worker)
-        thread.daemon = True
-        thread.start()
+        self._request_scan()
 
     def _scan_worker(self) -> None:
         self._apply_state(MenuState.SCANNING)
         try:
+            from .scan_cycle import ScanInProgressError, perform_scan
+
             result = perform_scan(self.config, open_report=True)
             self._last_summary = result.summary
             self._last_update_count = result.update_count
@@ -260,6 +321,9 @@ class MenuBarApp(rumps.App):
                 self._apply_state(MenuState.UPDATES)
             else:
                 self._apply_state(MenuState.IDLE)
+        except ScanInProgressError:
+            self._apply_state(MenuState.UPDATES if self._last_update_count > 0 else MenuState.IDLE)
+            self._request_scan(self.config.debounce_seconds)
         except Exception as exc:
             self._apply_state(MenuState.IDLE)
             self._last_scan_time = datetime.now()
@@ -270,11 +334,6 @@ class MenuBarApp(rumps.App):
                 self._alert_scan_permissions()
             else:
                 rumps.alert("Scan failed", str(exc))
-        finally:
-            self._scan_lock.release()
-            if self._pending_scan:
-                self._pending_scan = False
-                self._on_scan()
 
     def _on_open_report(self, _sender=None) -> None:
         if self.config.reports_backend != "local":
@@ -305,7 +364,13 @@ class MenuBarApp(rumps.App):
         if not self._last_summary:
             rumps.alert("No report yet", "Run a scan first.")
             return
-        result = perform_scan(self.config, open_report=True)
+        from .scan_cycle import ScanInProgressError, perform_scan
+
+        try:
+            result = perform_scan(self.config, open_report=True)
+        except ScanInProgressError:
+            rumps.alert("Scan in progress", "Try again when the current scan finishes.")
+            return
         self._last_summary = result.summary
         self._last_update_count = result.update_count
         self._last_report_path = result.report_path
@@ -377,7 +442,7 @@ class MenuBarApp(rumps.App):
 
     def _apply_settings(self, updated: Config) -> None:
         self.config = updated
-        self._setup_timer()
+        self._setup_scheduler()
         self._setup_watcher()
         self._update_auto_update_item()
 
@@ -395,6 +460,7 @@ class MenuBarApp(rumps.App):
 
     def _on_quit(self, _sender=None) -> None:
         self._teardown_watcher()
+        self._stop_scheduler()
         rumps.quit_application()
 
     def _on_uninstall(self, _sender=None) -> None:
@@ -434,20 +500,8 @@ class MenuBarApp(rumps.App):
 
 
     def _on_toggle_auto_update(self, _sender=None) -> None:
-        updated = Config(
-            machine_name=self.config.machine_name,
-            plugins_path=self.config.plugins_path,
-            reports_path=self.config.reports_path,
-            reports_backend=self.config.reports_backend,
-            dropbox_app_key=self.config.dropbox_app_key,
-            dropbox_app_secret=self.config.dropbox_app_secret,
-            dropbox_refresh_token=self.config.dropbox_refresh_token,
-            dropbox_reports_path=self.config.dropbox_reports_path,
-            scan_interval_seconds=self.config.scan_interval_seconds,
-            debounce_seconds=self.config.debounce_seconds,
-            hash_binaries=self.config.hash_binaries,
-            prune_days=self.config.prune_days,
-            auto_update_download=not self.config.auto_update_download,
+        updated = replace(
+            self.config, auto_update_download=not self.config.auto_update_download
         )
         write_config(updated)
         self.config = updated
@@ -540,12 +594,10 @@ def run_menubar() -> None:
 
 
 def _open_path(path: str, app: str | None = None) -> None:
-    if shutil.which("open") is None:
+    if _OPEN_BIN is None:
         return
-    if app:
-        subprocess.run(["open", "-a", app, path], capture_output=True, text=True)
-    else:
-        subprocess.run(["open", path], capture_output=True, text=True)
+    command = [_OPEN_BIN, "-a", app, path] if app else [_OPEN_BIN, path]
+    subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
 def _dropbox_reports_url(reports_path: str | None) -> str:
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import re
+
 ARCHIVE_DIR_NAME = "old scans"
 DIFF_FILENAME = "diff__latest.json"
 SUMMARY_FILENAME = "summary__latest.json"
+COMBINED_HTML_LATEST_FILENAME = "report__latest.html"
+COMBINED_JSON_LATEST_FILENAME = "report__latest.json"
+
+_TIMESTAMPED_REPORT_RE = re.compile(
+    r"(?!diff__|summary__)(?!.*__latest\.json\Z).*__.*\.json",
+    re.DOTALL,
+)
+_match_timestamped_report = _TIMESTAMPED_REPORT_RE.fullmatch
 
 
 def is_timestamped_report(name: str) -> bool:
-    if not name.endswith(".json"):
-        return False
-    if name.endswith("__latest.json"):
-        return False
-    if name.startswith("diff__") or name.startswith("summary__"):
-        return False
-    return "__" in name
+    return _match_timestamped_report(name) is not None
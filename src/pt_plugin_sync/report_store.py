@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import json
 import pathlib
 from dataclasses import dataclass
 from typing import Protocol
 
+from .combined_report import build_combined_report_payload
 from .combined_report import write_combined_report as write_local_combined_report
 from .config import Config
 from .diffing import load_latest_reports as load_local_reports
 from .diffing import write_diff as write_local_diff
 from .diffing import write_summary as write_local_summary
 from .reporting import prune_reports as prune_local_reports
+from .report_naming import DIFF_FILENAME, SUMMARY_FILENAME
 from .reporting import write_report as write_local_report
 
 
@@ -26,6 +29,9 @@ class ReportStore(Protocol):
     def write_combined_report(self, reports: dict[str, dict], summary: dict, diff: dict) -> None:
         raise NotImplementedError
 
+    def write_all(self, reports: dict[str, dict], summary: dict, diff: dict) -> None:
+        raise NotImplementedError
+
     def load_latest_reports(self) -> dict[str, dict]:
         raise NotImplementedError
 
@@ -49,6 +55,22 @@ class LocalReportStore:
     def write_combined_report(self, reports: dict[str, dict], summary: dict, diff: dict) -> None:
         write_local_combined_report(self.reports_dir, reports, summary, diff)
 
+    def write_all(self, reports: dict[str, dict], summary: dict, diff: dict) -> None:
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        html_payload, json_payload, latest_html, latest_json = build_combined_report_payload(
+            reports,
+            summary,
+            diff,
+        )
+        outputs = (
+            (DIFF_FILENAME, json.dumps(diff, indent=2, sort_keys=True) + "\n"),
+            (SUMMARY_FILENAME, json.dumps(summary, indent=2, sort_keys=True) + "\n"),
+            (latest_html, html_payload),
+            (latest_json, json_payload + "\n"),
+        )
+        for name, payload in outputs:
+            (self.reports_dir / name).write_text(payload, encoding="utf-8")
+
     def load_latest_reports(self) -> dict[str, dict]:
         return load_local_reports(self.reports_dir)
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
 import pathlib
+import shutil
 from datetime import datetime, timezone
 from typing import Iterable
 
@@ -65,27 +67,59 @@ def write_report(reports_dir: pathlib.Path, report: dict) -> tuple[pathlib.Path,
     timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
     timestamped = _archive_dir(reports_dir) / f"{machine_name}__{timestamp}.json"
     latest = reports_dir / f"{machine_name}__latest.json"
-    with timestamped.open("w", encoding="utf-8") as handle:
-        json.dump(report, handle, indent=2, sort_keys=True)
-        handle.write("\n")
-    with latest.open("w", encoding="utf-8") as handle:
-        json.dump(report, handle, indent=2, sort_keys=True)
-        handle.write("\n")
+    payload = (json.dumps(report, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    _replace_with_bytes(timestamped, payload)
+    _replace_with_link(latest, timestamped, payload)
     return timestamped, latest
 
 
+def _replace_with_bytes(path: pathlib.Path, payload: bytes) -> None:
+    temp = path.with_name(f".{path.name}.tmp")
+    temp.write_bytes(payload)
+    os.replace(temp, path)
+
+
+def _replace_with_link(
+    path: pathlib.Path, source: pathlib.Path, payload: bytes | None = None
+) -> None:
+    temp = path.with_name(f".{path.name}.tmp")
+    try:
+        temp.unlink(missing_ok=True)
+        os.link(source, temp)
+    except OSError:
+        if payload is None:
+            shutil.copyfile(source, temp)
+            os.replace(temp, path)
+            return
+        _replace_with_bytes(path, payload)
+        return
+    os.replace(temp, path)
+
+
+def _expired_reports(root: pathlib.Path, cutoff: float) -> list[str]:
+    expired = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if not is_timestamped_report(entry.name):
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        expired.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        return []
+    return expired
+
+
 def prune_reports(reports_dir: pathlib.Path, prune_days: int) -> None:
     if prune_days <= 0:
         return
     cutoff = datetime.now(tz=timezone.utc).timestamp() - (prune_days * 86400)
     for root in (reports_dir, _archive_dir(reports_dir)):
-        if not root.exists():
-            continue
-        for path in root.glob("*.json"):
-            if not is_timestamped_report(path.name):
-                continue
+        for path in _expired_reports(root, cutoff):
             try:
-                if path.stat().st_mtime < cutoff:
-                    path.unlink()
+                os.unlink(path)
             except OSError:
                 continue
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import fcntl
+import os
 import pathlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
+from .combined_report import open_report as open_combined_report
+from . import config as config_module
 from .config import Config
 from .diffing import compute_diff, compute_update_summary
+from .report_naming import COMBINED_HTML_LATEST_FILENAME
 from .report_store import report_store_from_config
 from .reporting import build_report
 from .scanner import scan_plugins
-from .combined_report import COMBINED_HTML_LATEST_FILENAME, open_report as open_combined_report
+
+SCAN_LOCK_FILENAME = ".scan.lock"
+SCAN_LOCK_TIMEOUT_SECONDS = 600
+_SCAN_LOCK_POLL_SECONDS = 0.5
 
 
 @dataclass
@@ -25,31 +36,119 @@ def _count_updates(summary: dict | None, machine_name: str) -> int:
     updates = summary.get("updates_by_machine", {}).get(machine_name, [])
     if not isinstance(updates, list):
         return 0
-    return sum(1 for update in updates if isinstance(update, dict))
+    return len(updates)
+
+
+class ScanInProgressError(RuntimeError):
+    pass
+
+
+@dataclass
+class _ScanTicket:
+    done: bool = False
+    result: ScanResult | None = None
+    error: BaseException | None = None
+
+
+_SCAN_STATE = threading.Condition()
+_RUNNING_SCAN: _ScanTicket | None = None
+_QUEUED_SCAN: _ScanTicket | None = None
+
+
+def _scan_lock_path() -> pathlib.Path:
+    return config_module.CONFIG_DIR / SCAN_LOCK_FILENAME
+
+
+def _remaining(deadline: float) -> float:
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def _finish_ticket(
+    ticket: _ScanTicket,
+    result: ScanResult | None = None,
+    error: BaseException | None = None,
+) -> None:
+    ticket.done = True
+    ticket.result = result
+    ticket.error = error
+    _SCAN_STATE.notify_all()
 
 
 def perform_scan(config: Config, *, open_report: bool = True) -> ScanResult:
+    global _RUNNING_SCAN, _QUEUED_SCAN
+    deadline = time.monotonic() + SCAN_LOCK_TIMEOUT_SECONDS
+    with _SCAN_STATE:
+        if _RUNNING_SCAN is None:
+            ticket = _RUNNING_SCAN = _ScanTicket()
+        elif _QUEUED_SCAN is not None:
+            queued = _QUEUED_SCAN
+            if not _SCAN_STATE.wait_for(lambda: queued.done, _remaining(deadline)):
+                raise ScanInProgressError("A scan is already running.")
+            if queued.error is not None:
+                raise queued.error
+            return queued.result
+        else:
+            ticket = _QUEUED_SCAN = _ScanTicket()
+            if not _SCAN_STATE.wait_for(lambda: _RUNNING_SCAN is None, _remaining(deadline)):
+                _QUEUED_SCAN = None
+                error = ScanInProgressError("A scan is already running.")
+                _finish_ticket(ticket, error=error)
+                raise error
+            _RUNNING_SCAN, _QUEUED_SCAN = ticket, None
+    try:
+        result = _perform_scan_exclusive(config, open_report=open_report, deadline=deadline)
+    except BaseException as exc:
+        with _SCAN_STATE:
+            _RUNNING_SCAN = None
+            _finish_ticket(ticket, error=exc)
+        raise
+    with _SCAN_STATE:
+        _RUNNING_SCAN = None
+        _finish_ticket(ticket, result=result)
+    return result
+
+
+def _perform_scan_exclusive(config: Config, *, open_report: bool, deadline: float) -> ScanResult:
+    lock_path = _scan_lock_path()
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise ScanInProgressError("Another process is already scanning.") from None
+                time.sleep(_SCAN_LOCK_POLL_SECONDS)
+        try:
+            return _perform_scan_locked(config, open_report=open_report)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _perform_scan_locked(config: Config, *, open_report: bool) -> ScanResult:
     plugins = scan_plugins(config.expanded_plugins_path(), config.hash_binaries)
     report = build_report(config, plugins)
     store = report_store_from_config(config)
     store.write_report(report)
-    store.prune_reports(config.prune_days)
-    reports = store.load_latest_reports()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pruned = executor.submit(store.prune_reports, config.prune_days)
+        reports = store.load_latest_reports()
+        pruned.result()
     if not reports:
         return ScanResult(diff=None, summary=None, update_count=0, report_path=None)
     diff = compute_diff(reports)
-    store.write_diff(diff)
     summary = compute_update_summary(reports)
-    store.write_summary(summary)
+    store.write_all(reports, summary, diff)
     update_count = _count_updates(summary, config.machine_name)
-    store.write_combined_report(reports, summary, diff)
     report_path = None
     if config.reports_backend == "local":
-        latest = config.expanded_reports_path() / COMBINED_HTML_LATEST_FILENAME
-        if latest.exists():
-            report_path = latest
-            if open_report and update_count > 0:
-                open_combined_report(report_path)
+        report_path = config.expanded_reports_path() / COMBINED_HTML_LATEST_FILENAME
+        if open_report and update_count > 0:
+            open_combined_report(report_path)
     return ScanResult(
         diff=diff,
         summary=summary,
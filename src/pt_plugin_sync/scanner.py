@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import dataclasses
 import hashlib
+import mmap
 import os
 import pathlib
 import plistlib
-from dataclasses import dataclass
+import re
+import threading
+import xml.parsers.expat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Iterable
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PluginInfo:
     bundle_name: str
     bundle_id: str | None
@@ -17,85 +22,241 @@ class PluginInfo:
     bundle_version: str | None
     mtime: float
     binary_hash: str | None = None
+    key: str = field(init=False, repr=False, compare=False)
+    version: tuple[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "key", self.bundle_id or self.bundle_name)
+        object.__setattr__(
+            self,
+            "version",
+            (self.short_version or "unknown", self.bundle_version or "unknown"),
+        )
+
+
+_HASH_BUFFER_SIZE = 1024 * 1024
+_MMAP_HASH_LIMIT = 16 * 1024 * 1024
+_EMPTY_DIGEST = hashlib.sha256().digest()
+_DIGEST_CACHE: dict[str, tuple[int, int, bytes]] = {}
+_HASH_BUFFERS = threading.local()
+_FILE_HASH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pt-plugin-hash")
+_INFO_CACHE: dict[str, tuple[int, int, dict]] = {}
 
 
 def _hash_bundle_binaries(bundle_path: pathlib.Path) -> str | None:
     macos_dir = bundle_path / "Contents" / "MacOS"
-    if not macos_dir.exists() or not macos_dir.is_dir():
+    try:
+        with os.scandir(macos_dir) as entries:
+            files = sorted(
+                (entry for entry in entries if entry.is_file(follow_symlinks=False)),
+                key=lambda e: e.name,
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return None
-    hasher = hashlib.sha256()
-    files = sorted([p for p in macos_dir.iterdir() if p.is_file()])
     if not files:
         return None
-    for file_path in files:
-        hasher.update(file_path.name.encode("utf-8"))
-        with file_path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                hasher.update(chunk)
+    if len(files) > 1:
+        digests = list(_FILE_HASH_POOL.map(_file_digest, files))
+    else:
+        digests = [_file_digest(entry) for entry in files]
+    hasher = hashlib.sha256()
+    for entry, digest in zip(files, digests):
+        hasher.update(entry.name.encode("utf-8"))
+        hasher.update(digest)
     return hasher.hexdigest()
 
 
+def _hash_buffer() -> memoryview:
+    buffer = getattr(_HASH_BUFFERS, "buffer", None)
+    if buffer is None:
+        buffer = memoryview(bytearray(_HASH_BUFFER_SIZE))
+        _HASH_BUFFERS.buffer = buffer
+    return buffer
+
+
+def _file_digest(entry: os.DirEntry) -> bytes:
+    stat = entry.stat(follow_symlinks=False)
+    if stat.st_size == 0:
+        return _EMPTY_DIGEST
+    cached = _DIGEST_CACHE.get(entry.path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    digest = _sha256_file(entry.path)
+    _DIGEST_CACHE[entry.path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def _sha256_file(path: str) -> bytes:
+    hasher = hashlib.sha256()
+    update = hasher.update
+    with open(path, "rb", buffering=0) as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if 0 < size <= _MMAP_HASH_LIMIT:
+            with mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                update(mapped)
+            return hasher.digest()
+        buffer = _hash_buffer()
+        readinto = handle.readinto
+        size = readinto(buffer)
+        while size:
+            update(buffer[:size])
+            size = readinto(buffer)
+    return hasher.digest()
+
+
+_INFO_KEYS = frozenset({"CFBundleIdentifier", "CFBundleShortVersionString", "CFBundleVersion"})
+
+
+_INFO_VALUE_RE = re.compile(
+    rb"<key>(CFBundleIdentifier|CFBundleShortVersionString|CFBundleVersion)</key>\s*"
+    rb"<string>([^<&]*)</string>"
+)
+_INFO_KEY_RE = re.compile(
+    rb"<key>(?:CFBundleIdentifier|CFBundleShortVersionString|CFBundleVersion)</key>"
+)
+
+
+def _scan_info_keys(data: bytes) -> dict | None:
+    if data.count(b"<dict") != 1:
+        return None
+    matches = _INFO_VALUE_RE.findall(data)
+    if len(matches) != len(_INFO_KEY_RE.findall(data)):
+        return None
+    return {key.decode("utf-8"): value.decode("utf-8") for key, value in matches}
+
+
+class _InfoKeysFound(Exception):
+    pass
+
+
+def _parse_info_keys(data: bytes) -> dict | None:
+    values: dict[str, str] = {}
+    state = {"depth": 0, "tag": None, "key": None, "text": []}
+
+    def start(name, _attrs):
+        if name == "dict":
+            state["depth"] += 1
+        state["tag"] = name
+        state["text"] = []
+
+    def end(name):
+        text = "".join(state["text"])
+        if name == "dict":
+            state["depth"] -= 1
+        elif state["depth"] == 1 and name == "key":
+            state["key"] = text
+            return
+        elif state["depth"] == 1 and state["key"] in _INFO_KEYS:
+            if name == "string":
+                values[state["key"]] = text
+                if len(values) == len(_INFO_KEYS):
+                    raise _InfoKeysFound
+        state["key"] = None
+
+    def characters(text):
+        state["text"].append(text)
+
+    parser = xml.parsers.expat.ParserCreate()
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = characters
+    try:
+        parser.Parse(data, True)
+    except _InfoKeysFound:
+        pass
+    except xml.parsers.expat.ExpatError:
+        return None
+    return values
+
+
+def _load_info_plist(data: bytes) -> dict:
+    if data.startswith(b"bplist"):
+        return plistlib.loads(data)
+    values = _scan_info_keys(data)
+    if values is not None:
+        return values
+    values = _parse_info_keys(data)
+    if values is None:
+        return plistlib.loads(data)
+    return values
+
+
 def _read_info_plist(bundle_path: pathlib.Path) -> dict:
-    plist_path = bundle_path / "Contents" / "Info.plist"
-    if not plist_path.exists():
-        return {}
+    plist_path = str(bundle_path / "Contents" / "Info.plist")
     try:
-        with plist_path.open("rb") as handle:
-            return plistlib.load(handle)
+        stat = os.stat(plist_path)
+        cached = _INFO_CACHE.get(plist_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        with open(plist_path, "rb") as handle:
+            info = _load_info_plist(handle.read())
     except Exception:
         return {}
+    _INFO_CACHE[plist_path] = (stat.st_mtime_ns, stat.st_size, info)
+    return info
+
+
+_BUNDLE_SUFFIX = ".aaxplugin"
+_SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+def _scan_bundle(entry: os.DirEntry, hash_binaries: bool) -> PluginInfo | None:
+    try:
+        bundle_path = pathlib.Path(entry.path)
+        info = _read_info_plist(bundle_path)
+        bundle_id = info.get("CFBundleIdentifier") or None
+        short_version = info.get("CFBundleShortVersionString") or None
+        bundle_version = info.get("CFBundleVersion") or None
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            mtime = 0
+        binary_hash = _hash_bundle_binaries(bundle_path) if hash_binaries else None
+    except OSError:
+        return None
+    return PluginInfo(
+        bundle_name=entry.name,
+        bundle_id=bundle_id,
+        short_version=short_version,
+        bundle_version=bundle_version,
+        mtime=mtime,
+        binary_hash=binary_hash,
+    )
 
 
 def scan_plugins(root_path: pathlib.Path, hash_binaries: bool = False) -> list[PluginInfo]:
-    plugins: list[PluginInfo] = []
     if not root_path.exists() or not root_path.is_dir():
-        return plugins
+        return []
     if not os.access(root_path, os.R_OK | os.X_OK):
         raise PermissionError(f"Permission denied reading plug-ins folder: {root_path}")
+    bundles: list[os.DirEntry] = []
     try:
         with os.scandir(root_path) as entries:
             for entry in entries:
+                if not entry.name.endswith(_BUNDLE_SUFFIX):
+                    continue
                 try:
-                    if not entry.is_dir():
-                        continue
-                    if not entry.name.endswith(".aaxplugin"):
-                        continue
-                    bundle_path = pathlib.Path(entry.path)
-                    info = _read_info_plist(bundle_path)
-                    bundle_id = info.get("CFBundleIdentifier") or None
-                    short_version = info.get("CFBundleShortVersionString") or None
-                    bundle_version = info.get("CFBundleVersion") or None
-                    try:
-                        mtime = bundle_path.stat().st_mtime
-                    except OSError:
-                        mtime = 0
-                    binary_hash = _hash_bundle_binaries(bundle_path) if hash_binaries else None
-                    plugins.append(
-                        PluginInfo(
-                            bundle_name=entry.name,
-                            bundle_id=bundle_id,
-                            short_version=short_version,
-                            bundle_version=bundle_version,
-                            mtime=mtime,
-                            binary_hash=binary_hash,
-                        )
-                    )
+                    if entry.is_dir():
+                        bundles.append(entry)
                 except OSError:
                     continue
     except PermissionError as exc:
         raise PermissionError(
             f"Permission denied reading plug-ins folder: {root_path}"
         ) from exc
+    if not bundles:
+        return []
+    workers = min(_SCAN_WORKERS, len(bundles))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_scan_bundle, bundles, [hash_binaries] * len(bundles))
+        plugins = [plugin for plugin in results if plugin is not None]
     plugins.sort(key=lambda item: item.bundle_name.lower())
     return plugins
 
 
 def plugin_key(plugin: PluginInfo) -> str:
-    return plugin.bundle_id or plugin.bundle_name
+    return plugin.key
 
 
 def plugin_version_tuple(plugin: PluginInfo) -> tuple[str, str]:
-    return (
-        plugin.short_version or "unknown",
-        plugin.bundle_version or "unknown",
-    )
+    return plugin.version
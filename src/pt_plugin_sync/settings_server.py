@@ -1,15 +1,14 @@
 from __future__ import annotations
 
-import html
+import functools
 from dataclasses import replace
-from email.parser import BytesParser
-from email.policy import default
+import socketserver
 import threading
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
-from http.server import BaseHTTPRequestHandler
-from socketserver import TCPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Callable
+from urllib.parse import unquote_plus
 
 try:
     import tomllib
@@ -20,6 +19,7 @@ from .config import (
     Config,
     DEFAULT_AUTO_UPDATE_DOWNLOAD,
     DEFAULT_DEBOUNCE_SECONDS,
+    DEFAULT_DROPBOX_REPORTS_PATH,
     DEFAULT_HASH_BINARIES,
     DEFAULT_REPORTS_BACKEND,
     DEFAULT_SCAN_INTERVAL_SECONDS,
@@ -28,14 +28,54 @@ from .config import (
 )
 from .dropbox_auth import DROPBOX_OAUTH_SCOPES
 
+_MAX_REQUEST_WORKERS = 8
+_MAX_BODY_BYTES = 1 << 20
+_VALID_BACKENDS = frozenset({"local", "dropbox"})
+
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+
+def _esc(value: str) -> str:
+    return value.translate(_HTML_ESCAPE_TABLE)
+
+
+class _PooledHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 64
+
+    def __init__(self, server_address, handler_class) -> None:
+        super().__init__(server_address, handler_class)
+        self._executor = ThreadPoolExecutor(
+            max_workers=_MAX_REQUEST_WORKERS, thread_name_prefix="settings-http"
+        )
+
+    def server_bind(self) -> None:
+        socketserver.TCPServer.server_bind(self)
+        host, port = self.server_address[:2]
+        self.server_name = host
+        self.server_port = port
+
+    def process_request(self, request, client_address) -> None:
+        self._executor.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._executor.shutdown(wait=False)
+
 
 class SettingsServer:
     def __init__(self, config: Config, on_save: Callable[[Config], None]) -> None:
         self._config = config
         self._on_save = on_save
-        self._server: TCPServer | None = None
+        self._server: ThreadingHTTPServer | None = None
         self._thread: threading.Thread | None = None
         self._url: str | None = None
+        self._form_cache: bytes | None = None
+        self._notice: str | None = None
+        self._lock = threading.Lock()
 
     @property
     def url(self) -> str | None:
@@ -48,8 +88,8 @@ class SettingsServer:
         if self._server is not None and self._url is not None:
             return self._url
 
-        handler = self._make_handler()
-        self._server = TCPServer(("127.0.0.1", 0), handler)
+        handler = functools.partial(_SettingsHandler, settings_server=self)
+        self._server = _PooledHTTPServer(("127.0.0.1", 0), handler)
         host, port = self._server.server_address
         self._url = f"http://{host}:{port}/"
         self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
@@ -68,156 +108,162 @@ class SettingsServer:
         self._server = None
         self._url = None
 
-    def _make_handler(self):
-        server = self
 
-        class Handler(BaseHTTPRequestHandler):
-            def log_message(self, _format, *_args) -> None:  # noqa: N802
+class _SettingsHandler(BaseHTTPRequestHandler):
+    wbufsize = -1
+
+    def __init__(self, *args, settings_server: SettingsServer, **kwargs) -> None:
+        self.settings_server = settings_server
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, _format, *_args) -> None:  # noqa: N802
+        return
+
+    def address_string(self) -> str:
+        return self.client_address[0]
+
+    def do_GET(self) -> None:  # noqa: N802
+        server = self.settings_server
+        if self.path in ("/", "/index.html"):
+            notice = _pop_notice(server)
+            if notice:
+                self._send_html(_render_form(server._config, notice=notice))
+                return
+            with server._lock:
+                if server._form_cache is None:
+                    server._form_cache = _render_form(server._config, notice=None)
+                body = server._form_cache
+            self._send_html(body)
+            return
+        if self.path == "/dropbox-auth-start":
+            app_key = server._config.dropbox_app_key or ""
+            app_secret = server._config.dropbox_app_secret or ""
+            if not app_key or not app_secret:
+                self._send_html(
+                    _render_error("Enter the Dropbox app key and secret first.")
+                )
+                return
+            try:
+                authorize_url = _dropbox_authorize_url(app_key, app_secret)
+            except Exception as exc:
+                self._send_html(_render_error(str(exc)))
+                return
+            self._send_html(
+                _render_dropbox_auth(app_key, app_secret, authorize_url)
+            )
+            return
+        self.send_error(HTTPStatus.NOT_FOUND)
+
+    def do_POST(self) -> None:  # noqa: N802
+        server = self.settings_server
+        if _content_length(self) > _MAX_BODY_BYTES:
+            self.send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return
+        if self.path == "/save":
+            values = _read_form_values(self)
+            try:
+                updated = _config_from_form(values, server._config)
+            except ValueError as exc:
+                self._send_html(_render_error(str(exc)))
+                return
+            error = _finalize_save(updated, server)
+            if error:
+                self._send_html(_render_error(error))
+                return
+            _set_notice(server, "Settings saved.")
+            self.send_response(HTTPStatus.SEE_OTHER)
+            self.send_header("Location", "/")
+            self.end_headers()
+            return
+        if self.path == "/dropbox-auth":
+            values = _read_form_values(self)
+            app_key = _get_text(values, "dropbox_app_key")
+            app_secret = _get_text(values, "dropbox_app_secret")
+            if not app_key or not app_secret:
+                self._send_html(
+                    _render_error("Dropbox app key and secret are required.")
+                )
+                return
+            try:
+                authorize_url = _dropbox_authorize_url(app_key, app_secret)
+            except Exception as exc:
+                self._send_html(_render_error(str(exc)))
+                return
+            self._send_html(
+                _render_dropbox_auth(app_key, app_secret, authorize_url)
+            )
+            return
+        if self.path == "/dropbox-finish":
+            values = _read_form_values(self)
+            app_key = _get_text(values, "dropbox_app_key")
+            app_secret = _get_text(values, "dropbox_app_secret")
+            auth_code = _get_text(values, "auth_code")
+            if not app_key or not app_secret:
+                self._send_html(
+                    _render_error("Dropbox app key and secret are required.")
+                )
+                return
+            if not auth_code:
+                self._send_html(_render_error("Authorization code is required."))
                 return
+            try:
+                refresh_token = _dropbox_finish_auth(
+                    app_key, app_secret, auth_code
+                )
+            except Exception as exc:
+                self._send_html(_render_error(str(exc)))
+                return
+            with server._lock:
+                server._config = replace(
+                    server._config,
+                    dropbox_app_key=app_key,
+                    dropbox_app_secret=app_secret,
+                    dropbox_refresh_token=refresh_token,
+                )
+                server._form_cache = None
+            _set_notice(
+                server,
+                "Dropbox refresh token captured. Click Save Settings to persist.",
+            )
+            self.send_response(HTTPStatus.SEE_OTHER)
+            self.send_header("Location", "/")
+            self.end_headers()
+            return
+        if self.path == "/import":
+            try:
+                updated = _config_from_upload(self, server._config)
+            except ValueError as exc:
+                self._send_html(_render_error(str(exc)))
+                return
+            error = _finalize_save(updated, server)
+            if error:
+                self._send_html(_render_error(error))
+                return
+            _set_notice(server, "Settings imported.")
+            self.send_response(HTTPStatus.SEE_OTHER)
+            self.send_header("Location", "/")
+            self.end_headers()
+            return
+        self.send_error(HTTPStatus.NOT_FOUND)
 
-            def do_GET(self) -> None:  # noqa: N802
-                if self.path in ("/", "/index.html"):
-                    notice = _pop_notice(server)
-                    body = _render_form(server._config, notice=notice)
-                    self._send_html(body)
-                    return
-                if self.path == "/dropbox-auth-start":
-                    app_key = server._config.dropbox_app_key or ""
-                    app_secret = server._config.dropbox_app_secret or ""
-                    if not app_key or not app_secret:
-                        self._send_html(
-                            _render_error("Enter the Dropbox app key and secret first.")
-                        )
-                        return
-                    try:
-                        authorize_url = _dropbox_authorize_url(app_key, app_secret)
-                    except Exception as exc:
-                        self._send_html(_render_error(str(exc)))
-                        return
-                    self._send_html(
-                        _render_dropbox_auth(app_key, app_secret, authorize_url)
-                    )
-                    return
-                self.send_error(HTTPStatus.NOT_FOUND)
-
-            def do_POST(self) -> None:  # noqa: N802
-                if self.path == "/save":
-                    values = _read_form_values(self)
-                    try:
-                        updated = _config_from_form(values, server._config)
-                    except ValueError as exc:
-                        self._send_html(_render_error(str(exc)))
-                        return
-                    error = _finalize_save(updated, server)
-                    if error:
-                        self._send_html(_render_error(error))
-                        return
-                    _set_notice(server, "Settings saved.")
-                    self.send_response(HTTPStatus.SEE_OTHER)
-                    self.send_header("Location", "/")
-                    self.end_headers()
-                    return
-                if self.path == "/dropbox-auth":
-                    values = _read_form_values(self)
-                    app_key = _get_text(values, "dropbox_app_key")
-                    app_secret = _get_text(values, "dropbox_app_secret")
-                    if not app_key or not app_secret:
-                        self._send_html(
-                            _render_error("Dropbox app key and secret are required.")
-                        )
-                        return
-                    try:
-                        authorize_url = _dropbox_authorize_url(app_key, app_secret)
-                    except Exception as exc:
-                        self._send_html(_render_error(str(exc)))
-                        return
-                    self._send_html(
-                        _render_dropbox_auth(app_key, app_secret, authorize_url)
-                    )
-                    return
-                if self.path == "/dropbox-finish":
-                    values = _read_form_values(self)
-                    app_key = _get_text(values, "dropbox_app_key")
-                    app_secret = _get_text(values, "dropbox_app_secret")
-                    auth_code = _get_text(values, "auth_code")
-                    if not app_key or not app_secret:
-                        self._send_html(
-                            _render_error("Dropbox app key and secret are required.")
-                        )
-                        return
-                    if not auth_code:
-                        self._send_html(_render_error("Authorization code is required."))
-                        return
-                    try:
-                        refresh_token = _dropbox_finish_auth(
-                            app_key, app_secret, auth_code
-                        )
-                    except Exception as exc:
-                        self._send_html(_render_error(str(exc)))
-                        return
-                    server._config = replace(
-                        server._config,
-                        dropbox_app_key=app_key,
-                        dropbox_app_secret=app_secret,
-                        dropbox_refresh_token=refresh_token,
-                    )
-                    _set_notice(
-                        server,
-                        "Dropbox refresh token captured. Click Save Settings to persist.",
-                    )
-                    self.send_response(HTTPStatus.SEE_OTHER)
-                    self.send_header("Location", "/")
-                    self.end_headers()
-                    return
-                if self.path == "/import":
-                    try:
-                        updated = _config_from_upload(self, server._config)
-                    except ValueError as exc:
-                        self._send_html(_render_error(str(exc)))
-                        return
-                    error = _finalize_save(updated, server)
-                    if error:
-                        self._send_html(_render_error(error))
-                        return
-                    _set_notice(server, "Settings imported.")
-                    self.send_response(HTTPStatus.SEE_OTHER)
-                    self.send_header("Location", "/")
-                    self.end_headers()
-                    return
-                self.send_error(HTTPStatus.NOT_FOUND)
-
-            def _send_html(self, body: str) -> None:
-                encoded = body.encode("utf-8")
-                self.send_response(HTTPStatus.OK)
-                self.send_header("Content-Type", "text/html; charset=utf-8")
-                self.send_header("Content-Length", str(len(encoded)))
-                self.end_headers()
-                self.wfile.write(encoded)
-
-        return Handler
-
-
-def _render_form(config: Config, *, notice: str | None) -> str:
-    def esc(value: str) -> str:
-        return html.escape(value, quote=True)
+    def _send_html(self, encoded: bytes) -> None:
+        head = (
+            f"{self.protocol_version} 200 OK\r\n"
+            "Content-Type: text/html; charset=utf-8\r\n"
+            f"Content-Length: {len(encoded)}\r\n"
+            "\r\n"
+        ).encode("ascii")
+        self.wfile.write(head + encoded)
 
-    backend = (config.reports_backend or "local").strip().lower()
-    backend_local = "selected" if backend == "local" else ""
-    backend_dropbox = "selected" if backend == "dropbox" else ""
-    hash_checked = "checked" if config.hash_binaries else ""
-    auto_update_checked = "checked" if config.auto_update_download else ""
-    dropbox_path = config.dropbox_reports_path or "/Pro Tools Plugin Reports"
-    notice_html = (
-        f'<div class="banner">{esc(notice)}</div>' if notice else ""
-    )
-    return f"""<!doctype html>
+
+_FORM_PREFIX = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
   <meta name="viewport" content="width=device-width, initial-scale=1">
   <title>Pro Tools Plugin Sync Settings</title>
   <style>
-    :root {{
+    :root {
       color-scheme: light;
       --bg: #0f3a3f;
       --panel: #fdf7eb;
@@ -228,8 +274,8 @@ def _render_form(config: Config, *, notice: str | None) -> str:
       --accent-soft: #f2e4c6;
       --line: #efe2c8;
       --shadow: rgba(6, 23, 24, 0.22);
-    }}
-    body {{
+    }
+    body {
       margin: 0;
       font-family: "SF Pro Text", "Helvetica Neue", "Avenir Next", sans-serif;
       background:
@@ -237,16 +283,16 @@ def _render_form(config: Config, *, notice: str | None) -> str:
         linear-gradient(120deg, rgba(255, 255, 255, 0.5), rgba(255, 255, 255, 0));
       color: var(--ink);
       min-height: 100vh;
-    }}
-    .backdrop {{
+    }
+    .backdrop {
       position: fixed;
       inset: 0;
       background:
         radial-gradient(circle at 10% 20%, rgba(255, 255, 255, 0.18), transparent 55%),
         radial-gradient(circle at 90% 10%, rgba(227, 192, 122, 0.25), transparent 50%);
       pointer-events: none;
-    }}
-    .wrap {{
+    }
+    .wrap {
       max-width: 820px;
       margin: 48px auto;
       padding: 36px 40px 28px;
@@ -257,46 +303,46 @@ def _render_form(config: Config, *, notice: str | None) -> str:
       position: relative;
       overflow: hidden;
       animation: lift 0.6s ease-out;
-    }}
-    .wrap::after {{
+    }
+    .wrap::after {
       content: "";
       position: absolute;
       inset: 0;
       background: linear-gradient(135deg, rgba(255, 242, 220, 0.5), transparent 45%);
       pointer-events: none;
-    }}
-    h1 {{
+    }
+    h1 {
       margin: 0 0 6px;
       font-family: "Avenir Next", "SF Pro Display", "Helvetica Neue", sans-serif;
       font-size: 28px;
       letter-spacing: 0.4px;
-    }}
-    h2 {{
+    }
+    h2 {
       font-family: "Avenir Next", "SF Pro Display", "Helvetica Neue", sans-serif;
       font-size: 18px;
       margin: 0 0 12px;
-    }}
-    p {{
+    }
+    p {
       margin: 0 0 22px;
       color: var(--muted);
-    }}
-    .section {{
+    }
+    .section {
       margin-top: 26px;
       padding-top: 18px;
       border-top: 1px solid var(--line);
       animation: fade 0.5s ease-out both;
-    }}
-    .section:nth-of-type(1) {{ animation-delay: 0.05s; }}
-    .section:nth-of-type(2) {{ animation-delay: 0.1s; }}
-    .section:nth-of-type(3) {{ animation-delay: 0.15s; }}
-    .section:nth-of-type(4) {{ animation-delay: 0.2s; }}
-    label {{
+    }
+    .section:nth-of-type(1) { animation-delay: 0.05s; }
+    .section:nth-of-type(2) { animation-delay: 0.1s; }
+    .section:nth-of-type(3) { animation-delay: 0.15s; }
+    .section:nth-of-type(4) { animation-delay: 0.2s; }
+    label {
       display: block;
       margin: 12px 0 6px;
       font-weight: 600;
       color: #2a251f;
-    }}
-    input, select {{
+    }
+    input, select {
       width: 100%;
       padding: 11px 12px;
       border-radius: 12px;
@@ -304,27 +350,27 @@ def _render_form(config: Config, *, notice: str | None) -> str:
       font-size: 14px;
       background: #fffaf1;
       transition: border-color 0.2s ease, box-shadow 0.2s ease;
-    }}
-    input:focus, select:focus {{
+    }
+    input:focus, select:focus {
       outline: none;
       border-color: var(--accent-dark);
       box-shadow: 0 0 0 3px rgba(227, 192, 122, 0.25);
-    }}
-    .row {{
+    }
+    .row {
       display: grid;
       grid-template-columns: 1fr 1fr;
       gap: 18px;
-    }}
-    .checkbox {{
+    }
+    .checkbox {
       display: flex;
       align-items: center;
       gap: 10px;
       margin-top: 10px;
-    }}
-    .checkbox input {{
+    }
+    .checkbox input {
       width: auto;
-    }}
-    .callout {{
+    }
+    .callout {
       margin-top: 12px;
       padding: 14px 16px;
       border-radius: 12px;
@@ -332,20 +378,20 @@ def _render_form(config: Config, *, notice: str | None) -> str:
       border: 1px solid #e8d2a7;
       color: #5a452a;
       font-size: 13px;
-    }}
-    .callout ol {{
+    }
+    .callout ol {
       margin: 10px 0 0 18px;
       padding: 0;
-    }}
-    .callout a {{
+    }
+    .callout a {
       color: #8b5a1a;
       text-decoration: none;
       font-weight: 600;
-    }}
-    .callout a:hover {{
+    }
+    .callout a:hover {
       text-decoration: underline;
-    }}
-    .banner {{
+    }
+    .banner {
       margin: 0 0 18px;
       padding: 10px 14px;
       border-radius: 12px;
@@ -353,88 +399,156 @@ def _render_form(config: Config, *, notice: str | None) -> str:
       border: 1px solid #c2d9d5;
       color: #1b4f52;
       font-weight: 600;
-    }}
-    .import-block {{
+    }
+    .import-block {
       margin-top: 18px;
       padding: 16px;
       border-radius: 14px;
       background: #f6edd8;
       border: 1px dashed #d9c49d;
-    }}
-    .import-block button {{
+    }
+    .import-block button {
       margin-top: 12px;
-    }}
-    .actions {{
+    }
+    .actions {
       margin-top: 30px;
       display: flex;
       justify-content: flex-end;
       gap: 12px;
       position: relative;
       z-index: 1;
-    }}
-    button {{
+    }
+    button {
       border: none;
       padding: 11px 20px;
       border-radius: 12px;
       font-size: 14px;
       cursor: pointer;
       transition: transform 0.15s ease, box-shadow 0.15s ease;
-    }}
-    button:active {{
+    }
+    button:active {
       transform: translateY(1px);
-    }}
-    .primary {{
+    }
+    .primary {
       background: var(--accent);
       color: #3b2a12;
       box-shadow: 0 10px 20px rgba(227, 192, 122, 0.35);
-    }}
-    .ghost {{
+    }
+    .ghost {
       background: transparent;
       border: 1px solid #d9c49d;
       color: var(--ink);
-    }}
-    .note {{
+    }
+    .note {
       font-size: 12px;
       color: var(--muted);
       margin-top: 8px;
-    }}
-    .hidden {{
+    }
+    .hidden {
       display: none;
-    }}
-    @keyframes lift {{
-      from {{ transform: translateY(10px); opacity: 0; }}
-      to {{ transform: translateY(0); opacity: 1; }}
-    }}
-    @keyframes fade {{
-      from {{ opacity: 0; transform: translateY(6px); }}
-      to {{ opacity: 1; transform: translateY(0); }}
-    }}
-    @media (max-width: 720px) {{
-      .row {{
+    }
+    @keyframes lift {
+      from { transform: translateY(10px); opacity: 0; }
+      to { transform: translateY(0); opacity: 1; }
+    }
+    @keyframes fade {
+      from { opacity: 0; transform: translateY(6px); }
+      to { opacity: 1; transform: translateY(0); }
+    }
+    @media (max-width: 720px) {
+      .row {
         grid-template-columns: 1fr;
-      }}
-      .wrap {{
+      }
+      .wrap {
         margin: 28px 16px;
         padding: 26px;
-      }}
-    }}
+      }
+    }
   </style>
 </head>
 <body>
   <div class="backdrop"></div>
   <div class="wrap">
     <form method="post" action="/save">
-      {notice_html}
+""".encode("utf-8")
+
+_FORM_SUFFIX = """
+
+    <form class="import-block" method="post" action="/import" enctype="multipart/form-data">
+      <strong>Import config file</strong>
+      <p class="note">Upload an existing config.toml to replace these values.</p>
+      <input type="file" name="config_file" accept=".toml,text/plain">
+      <button class="ghost" type="submit">Import Config</button>
+    </form>
+  </div>
+
+  <script>
+    const backend = document.getElementById('reports_backend');
+    const dropbox = document.getElementById('dropbox_section');
+    function toggleDropbox() {
+      dropbox.classList.toggle('hidden', backend.value !== 'dropbox');
+    }
+    backend.addEventListener('change', toggleDropbox);
+    toggleDropbox();
+
+    function startDropboxAuth() {
+      const appKey = document.getElementById('dropbox_app_key').value.trim();
+      const appSecret = document.getElementById('dropbox_app_secret').value.trim();
+      if (!appKey || !appSecret) {
+        window.alert('Enter the Dropbox app key and secret first.');
+        return;
+      }
+      const form = document.createElement('form');
+      form.method = 'post';
+      form.action = '/dropbox-auth';
+      const keyField = document.createElement('input');
+      keyField.type = 'hidden';
+      keyField.name = 'dropbox_app_key';
+      keyField.value = appKey;
+      const secretField = document.createElement('input');
+      secretField.type = 'hidden';
+      secretField.name = 'dropbox_app_secret';
+      secretField.value = appSecret;
+      form.appendChild(keyField);
+      form.appendChild(secretField);
+      document.body.appendChild(form);
+      form.submit();
+    }
+  </script>
+</body>
+</html>
+""".encode("utf-8")
+
+
+_BACKEND_SELECTED = {"local": ("selected", ""), "dropbox": ("", "selected")}
+_CHECKED = ("", "checked")
+_DEFAULT_DROPBOX_PATH_HTML = _esc(DEFAULT_DROPBOX_REPORTS_PATH)
+
+
+def _render_form(config: Config, *, notice: str | None) -> bytes:
+    backend = (config.reports_backend or "local").strip().lower()
+    backend_local, backend_dropbox = _BACKEND_SELECTED.get(backend, ("", ""))
+    hash_checked = _CHECKED[bool(config.hash_binaries)]
+    auto_update_checked = _CHECKED[bool(config.auto_update_download)]
+    dropbox_path = (
+        _esc(config.dropbox_reports_path)
+        if config.dropbox_reports_path
+        else _DEFAULT_DROPBOX_PATH_HTML
+    )
+    notice_html = (
+        f'<div class="banner">{_esc(notice)}</div>' if notice else ""
+    )
+    fields = f"""      {notice_html}
       <h1>Pro Tools Plugin Sync</h1>
       <p>Configure how scans run and where reports are stored.</p>
 
     <div class="section">
       <h2>General</h2>
       <label for="machine_name">Machine name</label>
-      <input id="machine_name" name="machine_name" value="{esc(config.machine_name)}">
+      <input id="machine_name" name="machine_name" value="{_esc(config.machine_name)}">
 
       <label for="plugins_path">Plugins folder</label>
-      <input id="plugins_path" name="plugins_path" value="{esc(config.plugins_path)}">
+      <input id="plugins_path" name="plugins_path" value="{_esc(config.plugins_path)}">
 
       <div class="row">
         <div>
@@ -457,7 +571,7 @@ def _render_form(config: Config, *, notice: str | None) -> str:
       </select>
 
       <label for="reports_path">Reports folder</label>
-      <input id="reports_path" name="reports_path" value="{esc(config.reports_path)}">
+      <input id="reports_path" name="reports_path" value="{_esc(config.reports_path)}">
     </div>
 
     <div class="section" id="dropbox_section">
@@ -473,16 +587,16 @@ def _render_form(config: Config, *, notice: str | None) -> str:
       </div>
 
       <label for="dropbox_reports_path">Dropbox reports path</label>
-      <input id="dropbox_reports_path" name="dropbox_reports_path" value="{esc(dropbox_path)}">
+      <input id="dropbox_reports_path" name="dropbox_reports_path" value="{dropbox_path}">
 
       <label for="dropbox_app_key">Dropbox app key</label>
-      <input id="dropbox_app_key" name="dropbox_app_key" value="{esc(config.dropbox_app_key or '')}">
+      <input id="dropbox_app_key" name="dropbox_app_key" value="{_esc(config.dropbox_app_key or '')}">
 
       <label for="dropbox_app_secret">Dropbox app secret</label>
-      <input id="dropbox_app_secret" name="dropbox_app_secret" value="{esc(config.dropbox_app_secret or '')}">
+      <input id="dropbox_app_secret" name="dropbox_app_secret" value="{_esc(config.dropbox_app_secret or '')}">
 
       <label for="dropbox_refresh_token">Dropbox refresh token</label>
-      <input id="dropbox_refresh_token" name="dropbox_refresh_token" value="{esc(config.dropbox_refresh_token or '')}">
+      <input id="dropbox_refresh_token" name="dropbox_refresh_token" value="{_esc(config.dropbox_refresh_token or '')}">
       <div class="note">Needed only when using Dropbox as the backend.</div>
 
       <button class="ghost" type="button" onclick="startDropboxAuth()">Authorize Dropbox...</button>
@@ -511,93 +625,43 @@ def _render_form(config: Config, *, notice: str | None) -> str:
         <button class="ghost" type="button" onclick="window.close()">Close</button>
         <button class="primary" type="submit">Save Settings</button>
       </div>
-    </form>
-
-    <form class="import-block" method="post" action="/import" enctype="multipart/form-data">
-      <strong>Import config file</strong>
-      <p class="note">Upload an existing config.toml to replace these values.</p>
-      <input type="file" name="config_file" accept=".toml,text/plain">
-      <button class="ghost" type="submit">Import Config</button>
-    </form>
-  </div>
-
-  <script>
-    const backend = document.getElementById('reports_backend');
-    const dropbox = document.getElementById('dropbox_section');
-    function toggleDropbox() {{
-      dropbox.classList.toggle('hidden', backend.value !== 'dropbox');
-    }}
-    backend.addEventListener('change', toggleDropbox);
-    toggleDropbox();
-
-    function startDropboxAuth() {{
-      const appKey = document.getElementById('dropbox_app_key').value.trim();
-      const appSecret = document.getElementById('dropbox_app_secret').value.trim();
-      if (!appKey || !appSecret) {{
-        window.alert('Enter the Dropbox app key and secret first.');
-        return;
-      }}
-      const form = document.createElement('form');
-      form.method = 'post';
-      form.action = '/dropbox-auth';
-      const keyField = document.createElement('input');
-      keyField.type = 'hidden';
-      keyField.name = 'dropbox_app_key';
-      keyField.value = appKey;
-      const secretField = document.createElement('input');
-      secretField.type = 'hidden';
-      secretField.name = 'dropbox_app_secret';
-      secretField.value = appSecret;
-      form.appendChild(keyField);
-      form.appendChild(secretField);
-      document.body.appendChild(form);
-      form.submit();
-    }}
-  </script>
-</body>
-</html>
-"""
+    </form>"""
+    return _FORM_PREFIX + fields.encode("utf-8") + _FORM_SUFFIX
 
 
 def _config_from_form(values: dict[str, list[str]], current: Config) -> Config:
-    def get_text(key: str, default: str = "") -> str:
-        return (values.get(key, [default])[0] or "").strip()
-
-    def get_int(key: str, default: int) -> int:
-        raw = get_text(key, str(default))
-        try:
-            return int(raw)
-        except ValueError as exc:
-            raise ValueError(f"{key} must be a number.") from exc
-
-    backend = get_text("reports_backend", current.reports_backend).lower()
-    if backend not in {"local", "dropbox"}:
+    backend = _get_text(values, "reports_backend", current.reports_backend).lower()
+    if backend not in _VALID_BACKENDS:
         raise ValueError("reports_backend must be local or dropbox.")
 
-    dropbox_reports_path = get_text(
-        "dropbox_reports_path", current.dropbox_reports_path or "/Pro Tools Plugin Reports"
+    dropbox_reports_path = _get_text(
+        values,
+        "dropbox_reports_path",
+        current.dropbox_reports_path or DEFAULT_DROPBOX_REPORTS_PATH,
+    )
+    dropbox_app_key = _get_text(values, "dropbox_app_key", current.dropbox_app_key or "")
+    dropbox_app_secret = _get_text(
+        values, "dropbox_app_secret", current.dropbox_app_secret or ""
     )
-    dropbox_app_key = get_text("dropbox_app_key", current.dropbox_app_key or "")
-    dropbox_app_secret = get_text("dropbox_app_secret", current.dropbox_app_secret or "")
-    dropbox_refresh_token = get_text(
-        "dropbox_refresh_token", current.dropbox_refresh_token or ""
+    dropbox_refresh_token = _get_text(
+        values, "dropbox_refresh_token", current.dropbox_refresh_token or ""
     )
 
     return Config(
-        machine_name=get_text("machine_name", current.machine_name),
-        plugins_path=get_text("plugins_path", current.plugins_path),
-        reports_path=get_text("reports_path", current.reports_path),
+        machine_name=_get_text(values, "machine_name", current.machine_name),
+        plugins_path=_get_text(values, "plugins_path", current.plugins_path),
+        reports_path=_get_text(values, "reports_path", current.reports_path),
         reports_backend=backend,
         dropbox_app_key=dropbox_app_key or None,
         dropbox_app_secret=dropbox_app_secret or None,
         dropbox_refresh_token=dropbox_refresh_token or None,
         dropbox_reports_path=dropbox_reports_path or None,
-        scan_interval_seconds=get_int(
-            "scan_interval_seconds", current.scan_interval_seconds
+        scan_interval_seconds=_get_int(
+            values, "scan_interval_seconds", current.scan_interval_seconds
         ),
-        debounce_seconds=get_int("debounce_seconds", current.debounce_seconds),
+        debounce_seconds=_get_int(values, "debounce_seconds", current.debounce_seconds),
         hash_binaries="hash_binaries" in values,
-        prune_days=get_int("prune_days", current.prune_days),
+        prune_days=_get_int(values, "prune_days", current.prune_days),
         auto_update_download="auto_update_download" in values,
     )
 
@@ -606,18 +670,22 @@ def _config_from_upload(handler: BaseHTTPRequestHandler, current: Config) -> Con
     if tomllib is None:
         raise ValueError("TOML parsing requires Python 3.11+.")
     content_type = handler.headers.get("Content-Type", "")
-    length = int(handler.headers.get("Content-Length", "0"))
-    if length <= 0:
+    data = _read_body(handler)
+    if not data:
         raise ValueError("Empty upload.")
-    data = handler.rfile.read(length)
     file_bytes = _extract_multipart_file(data, content_type, "config_file")
     try:
-        payload = tomllib.loads(file_bytes.decode("utf-8"))
+        payload = _parse_toml_bytes(file_bytes)
     except Exception as exc:
         raise ValueError(f"Failed to parse TOML: {exc}") from exc
     return _config_from_toml(payload, current)
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_toml_bytes(data: bytes) -> dict:
+    return tomllib.loads(data.decode("utf-8"))
+
+
 def _config_from_toml(payload: dict, current: Config) -> Config:
     def text(key: str, default: str) -> str:
         value = payload.get(key, default)
@@ -663,7 +731,9 @@ def _finalize_save(updated: Config, server: SettingsServer) -> str | None:
     validation = validate_config(updated)
     if not validation.ok:
         return "\n".join(validation.errors)
-    server._config = updated
+    with server._lock:
+        server._config = updated
+        server._form_cache = None
     write_config(updated)
     server._on_save(updated)
     return None
@@ -672,41 +742,107 @@ def _finalize_save(updated: Config, server: SettingsServer) -> str | None:
 def _extract_multipart_file(body: bytes, content_type: str, field_name: str) -> bytes:
     if not content_type.startswith("multipart/form-data"):
         raise ValueError("Expected multipart/form-data.")
-    header = f"Content-Type: {content_type}\r\n\r\n".encode("utf-8")
-    message = BytesParser(policy=default).parsebytes(header + body)
-    for part in message.iter_parts():
-        if part.get_content_disposition() != "form-data":
-            continue
-        name = part.get_param("name", header="content-disposition")
-        if name != field_name:
+    boundary = _multipart_boundary(content_type)
+    if not boundary:
+        raise ValueError("Missing multipart boundary.")
+    target = f'name="{field_name}"'.encode("utf-8")
+    for part in body.split(b"--" + boundary)[1:]:
+        if part.startswith(b"--"):
+            break
+        header_end = part.find(b"\r\n\r\n")
+        separator = 4
+        if header_end < 0:
+            header_end = part.find(b"\n\n")
+            separator = 2
+        if header_end < 0 or not _is_form_field(part[:header_end], target):
             continue
-        payload = part.get_payload(decode=True)
-        if payload is None:
-            raise ValueError("Uploaded file is empty.")
+        payload = part[header_end + separator :]
+        if payload.endswith(b"\r\n"):
+            return payload[:-2]
+        if payload.endswith(b"\n"):
+            return payload[:-1]
         return payload
     raise ValueError("No config_file provided.")
 
 
+def _multipart_boundary(content_type: str) -> bytes:
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary":
+            return value.strip().strip('"').encode("utf-8")
+    return b""
+
+
+def _is_form_field(headers: bytes, target: bytes) -> bool:
+    for line in headers.splitlines():
+        name, _, value = line.partition(b":")
+        if name.strip().lower() != b"content-disposition":
+            continue
+        params = [param.strip() for param in value.split(b";")]
+        return params[0].lower() == b"form-data" and target in params[1:]
+    return False
+
+
 def _read_form_values(handler: BaseHTTPRequestHandler) -> dict[str, list[str]]:
-    length = int(handler.headers.get("Content-Length", "0"))
-    data = handler.rfile.read(length).decode("utf-8")
-    return urllib.parse.parse_qs(data)
+    values: dict[str, list[str]] = {}
+    for pair in _read_body(handler).decode("utf-8").split("&"):
+        name, _, value = pair.partition("=")
+        if not value:
+            continue
+        values.setdefault(unquote_plus(name), []).append(unquote_plus(value))
+    return values
+
+
+def _content_length(handler: BaseHTTPRequestHandler) -> int:
+    try:
+        return max(int(handler.headers.get("Content-Length", "0")), 0)
+    except ValueError:
+        return 0
+
+
+def _read_body(handler: BaseHTTPRequestHandler) -> bytes:
+    length = min(_content_length(handler), _MAX_BODY_BYTES)
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    offset = 0
+    while offset < length:
+        count = handler.rfile.readinto(view[offset:])
+        if not count:
+            break
+        offset += count
+    return bytes(view[:offset])
 
 
 def _get_text(values: dict[str, list[str]], key: str, default: str = "") -> str:
-    return (values.get(key, [default])[0] or "").strip()
+    found = values.get(key)
+    return (found[0] if found else default).strip()
+
+
+def _get_int(values: dict[str, list[str]], key: str, default: int) -> int:
+    found = values.get(key)
+    if not found:
+        return default
+    try:
+        return int(found[0].strip())
+    except ValueError as exc:
+        raise ValueError(f"{key} must be a number.") from exc
 
 
 def _format_scopes(scopes: list[str]) -> str:
     return ", ".join(scopes)
 
 
-def _dropbox_authorize_url(app_key: str, app_secret: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _dropbox_flow_class():
     try:
         from dropbox import DropboxOAuth2FlowNoRedirect
     except Exception as exc:
         raise RuntimeError("Dropbox SDK not available.") from exc
-    flow = DropboxOAuth2FlowNoRedirect(
+    return DropboxOAuth2FlowNoRedirect
+
+
+def _dropbox_authorize_url(app_key: str, app_secret: str) -> str:
+    flow = _dropbox_flow_class()(
         app_key,
         app_secret,
         token_access_type="offline",
@@ -716,11 +852,7 @@ def _dropbox_authorize_url(app_key: str, app_secret: str) -> str:
 
 
 def _dropbox_finish_auth(app_key: str, app_secret: str, auth_code: str) -> str:
-    try:
-        from dropbox import DropboxOAuth2FlowNoRedirect
-    except Exception as exc:
-        raise RuntimeError("Dropbox SDK not available.") from exc
-    flow = DropboxOAuth2FlowNoRedirect(
+    flow = _dropbox_flow_class()(
         app_key,
         app_secret,
         token_access_type="offline",
@@ -734,24 +866,21 @@ def _dropbox_finish_auth(app_key: str, app_secret: str, auth_code: str) -> str:
     return oauth_result.refresh_token
 
 
-def _render_dropbox_auth(app_key: str, app_secret: str, authorize_url: str) -> str:
-    safe_url = html.escape(authorize_url, quote=True)
-    scopes = html.escape(_format_scopes(DROPBOX_OAUTH_SCOPES), quote=True)
-    return f"""<!doctype html>
+_DROPBOX_AUTH_PREFIX = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
   <meta name="viewport" content="width=device-width, initial-scale=1">
   <title>Dropbox Authorization</title>
   <style>
-    body {{
+    body {
       margin: 0;
       padding: 32px;
       font-family: "SF Pro Text", "Helvetica Neue", "Avenir Next", sans-serif;
       background: #f4f0e6;
       color: #1a1a18;
-    }}
-    .card {{
+    }
+    .card {
       max-width: 760px;
       margin: 0 auto;
       padding: 28px;
@@ -759,32 +888,32 @@ def _render_dropbox_auth(app_key: str, app_secret: str, authorize_url: str) -> s
       background: #ffffff;
       border: 1px solid #e0d6c1;
       box-shadow: 0 18px 36px rgba(24, 24, 24, 0.18);
-    }}
-    h1 {{
+    }
+    h1 {
       margin-top: 0;
       font-size: 24px;
-    }}
-    a {{
+    }
+    a {
       color: #8b5a1a;
       font-weight: 600;
       text-decoration: none;
-    }}
-    a:hover {{
+    }
+    a:hover {
       text-decoration: underline;
-    }}
-    label {{
+    }
+    label {
       display: block;
       margin-top: 16px;
       font-weight: 600;
-    }}
-    input {{
+    }
+    input {
       width: 100%;
       padding: 10px 12px;
       border-radius: 10px;
       border: 1px solid #dbcaa9;
       margin-top: 6px;
-    }}
-    button {{
+    }
+    button {
       margin-top: 18px;
       border: none;
       padding: 10px 18px;
@@ -792,12 +921,12 @@ def _render_dropbox_auth(app_key: str, app_secret: str, authorize_url: str) -> s
       background: #e3c07a;
       cursor: pointer;
       font-weight: 600;
-    }}
-    .note {{
+    }
+    .note {
       margin-top: 10px;
       font-size: 12px;
       color: #6e6a61;
-    }}
+    }
   </style>
 </head>
 <body>
@@ -806,11 +935,17 @@ def _render_dropbox_auth(app_key: str, app_secret: str, authorize_url: str) -> s
     <ol>
       <li>Open this URL in a browser and approve access:</li>
     </ol>
-    <p><a href="{safe_url}" target="_blank" rel="noopener">{safe_url}</a></p>
+""".encode("utf-8")
+
+
+def _render_dropbox_auth(app_key: str, app_secret: str, authorize_url: str) -> bytes:
+    safe_url = _esc(authorize_url)
+    scopes = _esc(_format_scopes(DROPBOX_OAUTH_SCOPES))
+    content = f"""    <p><a href="{safe_url}" target="_blank" rel="noopener">{safe_url}</a></p>
     <p class="note">Scopes requested: {scopes}</p>
     <form method="post" action="/dropbox-finish">
-      <input type="hidden" name="dropbox_app_key" value="{html.escape(app_key, quote=True)}">
-      <input type="hidden" name="dropbox_app_secret" value="{html.escape(app_secret, quote=True)}">
+      <input type="hidden" name="dropbox_app_key" value="{_esc(app_key)}">
+      <input type="hidden" name="dropbox_app_secret" value="{_esc(app_secret)}">
       <label for="auth_code">Authorization code</label>
       <input id="auth_code" name="auth_code" autocomplete="off">
       <button type="submit">Save refresh token</button>
@@ -820,38 +955,44 @@ def _render_dropbox_auth(app_key: str, app_secret: str, authorize_url: str) -> s
 </body>
 </html>
 """
+    return _DROPBOX_AUTH_PREFIX + content.encode("utf-8")
 
 
-def _render_error(message: str) -> str:
-    safe = html.escape(message, quote=True)
-    return f"""<!doctype html>
+_ERROR_PREFIX = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
   <title>Settings Error</title>
   <style>
-    body {{ font-family: "SF Pro Text", "Helvetica Neue", Helvetica, Arial, sans-serif; padding: 40px; }}
-    .card {{ max-width: 640px; margin: 0 auto; padding: 24px; border-radius: 12px; background: #fff3f0; }}
-    h1 {{ margin-top: 0; }}
-    pre {{ white-space: pre-wrap; }}
+    body { font-family: "SF Pro Text", "Helvetica Neue", Helvetica, Arial, sans-serif; padding: 40px; }
+    .card { max-width: 640px; margin: 0 auto; padding: 24px; border-radius: 12px; background: #fff3f0; }
+    h1 { margin-top: 0; }
+    pre { white-space: pre-wrap; }
   </style>
 </head>
 <body>
   <div class="card">
     <h1>Could not save settings</h1>
-    <pre>{safe}</pre>
+""".encode("utf-8")
+
+
+def _render_error(message: str) -> bytes:
+    safe = _esc(message)
+    content = f"""    <pre>{safe}</pre>
     <p><a href="/">Go back</a></p>
   </div>
 </body>
 </html>
 """
+    return _ERROR_PREFIX + content.encode("utf-8")
 
 
 def _set_notice(server: SettingsServer, message: str) -> None:
-    server._notice = message
+    with server._lock:
+        server._notice = message
 
 
 def _pop_notice(server: SettingsServer) -> str | None:
-    notice = getattr(server, "_notice", None)
-    server._notice = None
+    with server._lock:
+        notice, server._notice = server._notice, None
     return notice
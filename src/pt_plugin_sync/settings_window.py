@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pathlib
+import threading
 
 from AppKit import (
     NSAlert,
@@ -15,7 +16,6 @@ from AppKit import (
     NSRunningApplication,
     NSStackView,
     NSSwitchButton,
-    NSThread,
     NSTextField,
     NSView,
     NSWindow,
@@ -27,12 +27,32 @@ from AppKit import (
 )
 from Foundation import NSObject, NSURL, NSLog
 from PyObjCTools import AppHelper
-from objc import python_method, super as objc_super
+from objc import autorelease_pool, python_method, super as objc_super
 from dropbox import DropboxOAuth2FlowNoRedirect
 
 from .config import Config, validate_config, write_config
 from .dropbox_auth import DROPBOX_OAUTH_SCOPES
 
+_MAIN_THREAD = threading.main_thread()
+
+
+def _widget_values(config: Config) -> dict[str, object]:
+    return {
+        "machine_name": config.machine_name,
+        "plugins_path": config.plugins_path,
+        "scan_interval_seconds": str(config.scan_interval_seconds),
+        "debounce_seconds": str(config.debounce_seconds),
+        "reports_path": config.reports_path,
+        "dropbox_reports_path": config.dropbox_reports_path or "/Pro Tools Plugin Reports",
+        "dropbox_app_key": config.dropbox_app_key or "",
+        "dropbox_app_secret": config.dropbox_app_secret or "",
+        "dropbox_refresh_token": config.dropbox_refresh_token or "",
+        "prune_days": str(config.prune_days),
+        "hash_binaries": config.hash_binaries,
+        "auto_update_download": config.auto_update_download,
+        "reports_backend": (config.reports_backend or "local").lower(),
+    }
+
 
 class SettingsWindowController(NSObject):
     def initWithOnSave_(self, on_save):
@@ -42,17 +62,19 @@ class SettingsWindowController(NSObject):
         self._on_save = on_save
         self._window = None
         self._config: Config | None = None
+        self._last_applied: Config | None = None
         self._fields: dict[str, NSTextField] = {}
         self._checkboxes: dict[str, NSButton] = {}
         self._local_stack = None
         self._dropbox_stack = None
         self._backend_local = None
         self._backend_dropbox = None
+        self._oauth_cache: tuple | None = None
         return self
 
     def present_(self, config: Config) -> None:
         self._config = config
-        if NSThread.isMainThread():
+        if threading.current_thread() is _MAIN_THREAD:
             self._present()
             return
         AppHelper.callAfter(self._present)
@@ -66,7 +88,8 @@ class SettingsWindowController(NSObject):
             app.unhide_(None)
             if self._window is None:
                 self._build_window()
-            self._populate()
+            if self._config != self._last_applied:
+                self._populate()
             self._window.setHidesOnDeactivate_(False)
             self._window.makeKeyAndOrderFront_(None)
             self._window.orderFront_(None)
@@ -110,6 +133,7 @@ class SettingsWindowController(NSObject):
         )
         self._window.setTitle_("pt-plugin-sync Settings")
         self._window.setReleasedWhenClosed_(False)
+        self._window.setDelegate_(self)
         self._window.setLevel_(NSNormalWindowLevel)
         self._window.setCollectionBehavior_(
             NSWindowCollectionBehaviorCanJoinAllSpaces
@@ -200,21 +224,21 @@ class SettingsWindowController(NSObject):
     def _populate(self) -> None:
         if not self._config:
             return
-        self._set_field("machine_name", self._config.machine_name)
-        self._set_field("plugins_path", self._config.plugins_path)
-        self._set_field("scan_interval_seconds", str(self._config.scan_interval_seconds))
-        self._set_field("debounce_seconds", str(self._config.debounce_seconds))
-        self._set_field("reports_path", self._config.reports_path)
-        self._set_field(
-            "dropbox_reports_path", self._config.dropbox_reports_path or "/Pro Tools Plugin Reports"
-        )
-        self._set_field("dropbox_app_key", self._config.dropbox_app_key or "")
-        self._set_field("dropbox_app_secret", self._config.dropbox_app_secret or "")
-        self._set_field("dropbox_refresh_token", self._config.dropbox_refresh_token or "")
-        self._set_field("prune_days", str(self._config.prune_days))
-        self._set_checkbox("hash_binaries", self._config.hash_binaries)
-        self._set_checkbox("auto_update_download", self._config.auto_update_download)
-        backend = (self._config.reports_backend or "local").lower()
+        with autorelease_pool():
+            previous = _widget_values(self._last_applied) if self._last_applied else {}
+            for key, value in _widget_values(self._config).items():
+                if key in previous and previous[key] == value:
+                    continue
+                if key == "reports_backend":
+                    self._set_backend(value)
+                elif key in self._checkboxes:
+                    self._set_checkbox(key, value)
+                else:
+                    self._set_field(key, value)
+            self._last_applied = self._config
+
+    @python_method
+    def _set_backend(self, backend: str) -> None:
         if backend == "dropbox":
             self._backend_dropbox.setState_(1)
             self._backend_local.setState_(0)
@@ -226,8 +250,10 @@ class SettingsWindowController(NSObject):
     @python_method
     def _apply_backend_visibility(self) -> None:
         use_dropbox = self._backend_dropbox.state() == 1
-        self._dropbox_stack.setHidden_(not use_dropbox)
-        self._local_stack.setHidden_(use_dropbox)
+        if bool(self._dropbox_stack.isHidden()) == use_dropbox:
+            self._dropbox_stack.setHidden_(not use_dropbox)
+        if bool(self._local_stack.isHidden()) != use_dropbox:
+            self._local_stack.setHidden_(use_dropbox)
 
     @python_method
     def _label(self, text: str) -> NSTextField:
@@ -315,13 +341,18 @@ class SettingsWindowController(NSObject):
         if not app_key or not app_secret:
             self._alert("Dropbox setup", "App key and secret are required.")
             return
-        flow = DropboxOAuth2FlowNoRedirect(
-            app_key,
-            app_secret,
-            token_access_type="offline",
-            scope=DROPBOX_OAUTH_SCOPES,
-        )
-        authorize_url = flow.start()
+        cache_key = (app_key, app_secret)
+        if self._oauth_cache is not None and self._oauth_cache[0] == cache_key:
+            _key, flow, authorize_url = self._oauth_cache
+        else:
+            flow = DropboxOAuth2FlowNoRedirect(
+                app_key,
+                app_secret,
+                token_access_type="offline",
+                scope=DROPBOX_OAUTH_SCOPES,
+            )
+            authorize_url = flow.start()
+            self._oauth_cache = (cache_key, flow, authorize_url)
         NSWorkspace.sharedWorkspace().openURL_(NSURL.URLWithString_(authorize_url))
         alert = NSAlert.alloc().init()
         alert.setMessageText_("Dropbox authorization")
@@ -342,6 +373,7 @@ class SettingsWindowController(NSObject):
         except Exception as exc:
             self._alert("Dropbox setup", str(exc))
             return
+        self._oauth_cache = None
         if not result.refresh_token:
             self._alert(
                 "Dropbox setup",
@@ -350,7 +382,11 @@ class SettingsWindowController(NSObject):
             return
         self._set_field("dropbox_refresh_token", result.refresh_token)
 
+    def windowWillClose_(self, _notification) -> None:
+        self._last_applied = None
+
     def onCancel_(self, _sender) -> None:
+        self._last_applied = None
         if self._window:
             self._window.orderOut_(None)
 
@@ -394,6 +430,7 @@ class SettingsWindowController(NSObject):
             self._alert("Invalid settings", "\n".join(validation.errors))
             return
         write_config(updated)
+        self._last_applied = None
         if self._window:
             self._window.orderOut_(None)
         self._on_save(updated)
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import json
+import pathlib
 import re
+import urllib.error
 import urllib.request
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from importlib import metadata
 from typing import Iterable
 
 
 REPO_API = "https://api.github.com/repos/eric-silverman/pro-tools-plugin-sync/releases/latest"
 ASSET_PREFIX = "pro-tools-plugin-sync-"
+RELEASE_CACHE_PATH = pathlib.Path("~/Library/Caches/pt-plugin-sync/release.json").expanduser()
+
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+_search_version = _VERSION_RE.search
+
+_RELEASE_CACHE: tuple[str, ReleaseInfo | None] | None = None
 
 
 @dataclass
@@ -29,10 +37,10 @@ def current_version() -> str:
 
 
 def _parse_version(text: str) -> tuple[int, int, int]:
-    match = re.search(r"(\d+)\.(\d+)\.(\d+)", text)
+    match = _search_version(text)
     if not match:
         return (0, 0, 0)
-    return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    return (int(match[1]), int(match[2]), int(match[3]))
 
 
 def _asset_url(assets: Iterable[dict], version: str) -> str | None:
@@ -44,12 +52,49 @@ def _asset_url(assets: Iterable[dict], version: str) -> str | None:
 
 
 def latest_release() -> ReleaseInfo | None:
-    request = urllib.request.Request(
-        REPO_API,
-        headers={"User-Agent": "pt-plugin-sync"},
-    )
-    with urllib.request.urlopen(request, timeout=10) as response:
-        payload = json.loads(response.read().decode("utf-8"))
+    global _RELEASE_CACHE
+    headers = {"User-Agent": "pt-plugin-sync"}
+    cached = _RELEASE_CACHE
+    if cached is None:
+        cached = _RELEASE_CACHE = _load_release_cache()
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+    request = urllib.request.Request(REPO_API, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            payload = json.load(response)
+            etag = response.headers.get("ETag")
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304 and cached is not None:
+            return cached[1]
+        raise
+    release = _release_from_payload(payload)
+    _RELEASE_CACHE = (etag, release) if etag else None
+    if etag and (cached is None or cached[0] != etag):
+        _store_release_cache(etag, release)
+    return release
+
+
+def _load_release_cache() -> tuple[str, ReleaseInfo | None] | None:
+    try:
+        data = json.loads(RELEASE_CACHE_PATH.read_text(encoding="utf-8"))
+        etag = str(data["etag"])
+        release = ReleaseInfo(**data["release"]) if data["release"] else None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return (etag, release)
+
+
+def _store_release_cache(etag: str, release: ReleaseInfo | None) -> None:
+    data = {"etag": etag, "release": asdict(release) if release else None}
+    try:
+        RELEASE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        RELEASE_CACHE_PATH.write_text(json.dumps(data), encoding="utf-8")
+    except OSError:
+        return
+
+
+def _release_from_payload(payload: dict) -> ReleaseInfo | None:
     tag = str(payload.get("tag_name") or "")
     version = tag.lstrip("v")
     if not version:
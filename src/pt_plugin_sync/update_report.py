@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import html
+import functools
+import os
 import pathlib
 import shutil
 import subprocess
 from datetime import datetime, timezone
-from typing import Iterable
+from html import escape as _escape
+from typing import Iterable, Iterator
 
 from .config import Config
+from .reporting import _replace_with_link
 
 
 _REASON_LABELS = {
@@ -22,6 +25,11 @@ _REASON_ORDER = {
     "unknown_version": 2,
 }
 
+_ACTION_TEMPLATES = {
+    "missing": ("Install from {machine} ({target}).", "Install {target}."),
+    "outdated": ("Update from {machine} to {target}.", "Update to {target}."),
+}
+
 
 def _updates_for_machine(summary: dict, machine_name: str) -> list[dict]:
     updates = summary.get("updates_by_machine", {}).get(machine_name, [])
@@ -30,26 +38,25 @@ def _updates_for_machine(summary: dict, machine_name: str) -> list[dict]:
     return [update for update in updates if isinstance(update, dict)]
 
 
-def _action_text(update: dict) -> str:
-    best_machine = update.get("best_machine")
-    latest_version = update.get("latest_version")
-    reason = update.get("reason")
+def _has_updates_for_machine(summary: dict, machine_name: str) -> bool:
+    updates = summary.get("updates_by_machine", {}).get(machine_name, [])
+    if not isinstance(updates, list):
+        return False
+    return any(isinstance(update, dict) for update in updates)
 
-    target = "latest version"
-    if latest_version:
-        target = f"version {latest_version}"
 
-    if reason == "missing":
-        if best_machine:
-            return f"Install from {best_machine} ({target})."
-        return f"Install {target}."
-    if reason == "outdated":
+def _action_text(update: dict) -> str:
+    best_machine = update.get("best_machine")
+    templates = _ACTION_TEMPLATES.get(update.get("reason"))
+    if templates is None:
         if best_machine:
-            return f"Update from {best_machine} to {target}."
-        return f"Update to {target}."
+            return f"Verify version against {best_machine}."
+        return "Verify version manually."
+    latest_version = update.get("latest_version")
+    target = f"version {latest_version}" if latest_version else "latest version"
     if best_machine:
-        return f"Verify version against {best_machine}."
-    return "Verify version manually."
+        return templates[0].format(machine=best_machine, target=target)
+    return templates[1].format(target=target)
 
 
 def _format_version(value: str | None) -> str:
@@ -58,59 +65,41 @@ def _format_version(value: str | None) -> str:
     return value
 
 
-def _sort_updates(updates: Iterable[dict]) -> list[dict]:
-    def sort_key(update: dict) -> tuple[int, str]:
-        reason = update.get("reason", "")
-        label = update.get("bundle_name") or update.get("key") or ""
-        return (_REASON_ORDER.get(reason, 99), label.lower())
+def _update_sort_key(update: dict) -> tuple[int, str]:
+    label = update.get("bundle_name") or update.get("key") or ""
+    return (_REASON_ORDER.get(update.get("reason", ""), 99), label.lower())
 
-    return sorted(updates, key=sort_key)
 
+def _sort_updates(updates: Iterable[dict]) -> list[dict]:
+    return sorted(updates, key=_update_sort_key)
 
-def generate_update_report_html(summary: dict, machine_name: str) -> str:
-    updates = _sort_updates(_updates_for_machine(summary, machine_name))
-    total = len(updates)
-    missing = sum(1 for update in updates if update.get("reason") == "missing")
-    outdated = sum(1 for update in updates if update.get("reason") == "outdated")
-    unknown = sum(1 for update in updates if update.get("reason") == "unknown_version")
-    generated_at = summary.get("generated_at") or datetime.now(tz=timezone.utc).isoformat()
-    sources = sorted(
-        {update.get("best_machine") for update in updates if update.get("best_machine")}
+
+def _row_html(update: dict) -> str:
+    get = update.get
+    name = get("bundle_name") or get("key") or "Unknown plugin"
+    current_version = _format_version(get("current_version"))
+    latest_version = _format_version(get("latest_version"))
+    reason = _REASON_LABELS.get(get("reason"), "Update needed")
+    source = get("best_machine") or "Unknown"
+    action = _action_text(update)
+    return (
+        f"<tr><td>{_escape(str(name))}</td>"
+        f"<td>{_escape(str(current_version))}</td>"
+        f"<td>{_escape(str(latest_version))}</td>"
+        f"<td>{_escape(reason)}</td>"
+        f"<td>{_escape(str(source))}</td>"
+        f"<td>{_escape(action)}</td></tr>"
     )
-    source_text = ", ".join(sources) if sources else "Unknown"
 
-    def esc(value: object) -> str:
-        return html.escape(str(value))
 
-    rows = []
-    for update in updates:
-        name = update.get("bundle_name") or update.get("key") or "Unknown plugin"
-        current_version = _format_version(update.get("current_version"))
-        latest_version = _format_version(update.get("latest_version"))
-        reason = _REASON_LABELS.get(update.get("reason"), "Update needed")
-        source = update.get("best_machine") or "Unknown"
-        action = _action_text(update)
-        rows.append(
-            "<tr>"
-            f"<td>{esc(name)}</td>"
-            f"<td>{esc(current_version)}</td>"
-            f"<td>{esc(latest_version)}</td>"
-            f"<td>{esc(reason)}</td>"
-            f"<td>{esc(source)}</td>"
-            f"<td>{esc(action)}</td>"
-            "</tr>"
-        )
-
-    rows_html = "\n".join(rows) if rows else "<tr><td colspan='6'>All up to date.</td></tr>"
-
-    return f"""<!doctype html>
+_REPORT_HEAD = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
   <meta name="viewport" content="width=device-width, initial-scale=1">
   <title>Plugin Update Report</title>
   <style>
-    :root {{
+    :root {
       color-scheme: light;
       --bg: #f6f4ef;
       --card: #ffffff;
@@ -118,19 +107,19 @@ def generate_update_report_html(summary: dict, machine_name: str) -> str:
       --muted: #5a6b71;
       --border: #e2dfd6;
       --shadow: rgba(25, 33, 38, 0.08);
-    }}
-    body {{
+    }
+    body {
       margin: 0;
       font-family: "Avenir Next", "Helvetica Neue", Helvetica, Arial, sans-serif;
       background: radial-gradient(circle at top, #fff6e5, #f6f4ef 55%);
       color: #1d2427;
-    }}
-    .page {{
+    }
+    .page {
       max-width: 1100px;
       margin: 40px auto 60px;
       padding: 0 24px;
-    }}
-    .header {{
+    }
+    .header {
       display: flex;
       justify-content: space-between;
       align-items: flex-end;
@@ -140,66 +129,66 @@ def generate_update_report_html(summary: dict, machine_name: str) -> str:
       border-radius: 20px;
       box-shadow: 0 12px 30px var(--shadow);
       border: 1px solid var(--border);
-    }}
-    .title {{
+    }
+    .title {
       font-size: 28px;
       font-weight: 700;
       margin: 0 0 6px;
-    }}
-    .subtitle {{
+    }
+    .subtitle {
       color: var(--muted);
       margin: 0;
       font-size: 14px;
-    }}
-    .status {{
+    }
+    .status {
       text-align: right;
       font-size: 15px;
       color: var(--accent);
       font-weight: 600;
-    }}
-    .summary {{
+    }
+    .summary {
       display: grid;
       grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
       gap: 16px;
       margin-top: 24px;
-    }}
-    .summary-card {{
+    }
+    .summary-card {
       background: var(--card);
       border-radius: 16px;
       padding: 16px 18px;
       border: 1px solid var(--border);
       box-shadow: 0 6px 16px var(--shadow);
-    }}
-    .summary-card h3 {{
+    }
+    .summary-card h3 {
       margin: 0 0 6px;
       font-size: 13px;
       letter-spacing: 0.08em;
       text-transform: uppercase;
       color: var(--muted);
-    }}
-    .summary-card p {{
+    }
+    .summary-card p {
       margin: 0;
       font-size: 22px;
       font-weight: 700;
-    }}
-    .section {{
+    }
+    .section {
       margin-top: 28px;
       background: var(--card);
       border-radius: 20px;
       padding: 20px 24px 10px;
       border: 1px solid var(--border);
       box-shadow: 0 10px 26px var(--shadow);
-    }}
-    .section h2 {{
+    }
+    .section h2 {
       margin: 0 0 12px;
       font-size: 18px;
-    }}
-    table {{
+    }
+    table {
       width: 100%;
       border-collapse: collapse;
       font-size: 14px;
-    }}
-    thead th {{
+    }
+    thead th {
       text-align: left;
       color: var(--muted);
       font-size: 12px;
@@ -207,33 +196,33 @@ def generate_update_report_html(summary: dict, machine_name: str) -> str:
       text-transform: uppercase;
       border-bottom: 1px solid var(--border);
       padding: 10px 8px;
-    }}
-    tbody td {{
+    }
+    tbody td {
       border-bottom: 1px solid var(--border);
       padding: 12px 8px;
       vertical-align: top;
-    }}
-    tbody tr:last-child td {{
+    }
+    tbody tr:last-child td {
       border-bottom: none;
-    }}
-    .footer {{
+    }
+    .footer {
       margin-top: 24px;
       text-align: center;
       color: var(--muted);
       font-size: 12px;
-    }}
-    @media (max-width: 720px) {{
-      .header {{
+    }
+    @media (max-width: 720px) {
+      .header {
         flex-direction: column;
         align-items: flex-start;
-      }}
-      .status {{
+      }
+      .status {
         text-align: left;
-      }}
-      table {{
+      }
+      table {
         font-size: 13px;
-      }}
-    }}
+      }
+    }
   </style>
 </head>
 <body>
@@ -241,7 +230,47 @@ def generate_update_report_html(summary: dict, machine_name: str) -> str:
     <div class="header">
       <div>
         <h1 class="title">Plugin Update Report</h1>
-        <p class="subtitle">Machine: {esc(machine_name)} | Generated: {esc(generated_at)}</p>
+""".encode("utf-8")
+
+_REPORT_FOOTER = """
+        </tbody>
+      </table>
+    </div>
+    <div class="footer">pt-plugin-sync</div>
+  </div>
+</body>
+</html>
+""".encode("utf-8")
+
+
+def generate_update_report_html(summary: dict, machine_name: str) -> str:
+    return b"".join(_iter_update_report_html(summary, machine_name)).decode("utf-8")
+
+
+def _iter_update_report_html(summary: dict, machine_name: str) -> Iterator[bytes]:
+    updates = _sort_updates(_updates_for_machine(summary, machine_name))
+    total = len(updates)
+    missing = outdated = unknown = 0
+    source_set = set()
+    for update in updates:
+        reason = update.get("reason")
+        if reason == "missing":
+            missing += 1
+        elif reason == "outdated":
+            outdated += 1
+        elif reason == "unknown_version":
+            unknown += 1
+        best_machine = update.get("best_machine")
+        if best_machine:
+            source_set.add(best_machine)
+    generated_at = summary.get("generated_at") or datetime.now(tz=timezone.utc).isoformat()
+    sources = sorted(source_set)
+    source_text = ", ".join(sources) if sources else "Unknown"
+
+    def esc(value: object) -> str:
+        return _escape(str(value))
+
+    content = f"""        <p class="subtitle">Machine: {esc(machine_name)} | Generated: {esc(generated_at)}</p>
         <p class="subtitle">Latest versions sourced from: {esc(source_text)}</p>
       </div>
       <div class="status">{total} updates needed</div>
@@ -278,15 +307,17 @@ def generate_update_report_html(summary: dict, machine_name: str) -> str:
           </tr>
         </thead>
         <tbody>
-          {rows_html}
-        </tbody>
-      </table>
-    </div>
-    <div class="footer">pt-plugin-sync</div>
-  </div>
-</body>
-</html>
-"""
+          """
+    yield _REPORT_HEAD
+    yield content.encode("utf-8")
+    if not updates:
+        yield b"<tr><td colspan='6'>All up to date.</td></tr>"
+    row_html = _row_html
+    separator = ""
+    for update in updates:
+        yield (separator + row_html(update)).encode("utf-8")
+        separator = "\n"
+    yield _REPORT_FOOTER
 
 
 def write_update_report(
@@ -296,24 +327,43 @@ def write_update_report(
 ) -> pathlib.Path:
     reports_dir.mkdir(parents=True, exist_ok=True)
     safe_machine = machine_name.replace("/", "-")
-    timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
+    now = datetime.now(tz=timezone.utc)
+    if not summary.get("generated_at"):
+        summary = {**summary, "generated_at": now.isoformat()}
+    timestamp = now.strftime("%Y%m%d-%H%M%S")
     timestamped = reports_dir / f"updates__{safe_machine}__{timestamp}.html"
     latest = reports_dir / f"updates__{safe_machine}__latest.html"
-    html_payload = generate_update_report_html(summary, machine_name)
-    timestamped.write_text(html_payload, encoding="utf-8")
-    latest.write_text(html_payload, encoding="utf-8")
+    temp = timestamped.with_name(f".{timestamped.name}.tmp")
+    with temp.open("wb") as handle:
+        handle.writelines(_iter_update_report_html(summary, machine_name))
+    os.replace(temp, timestamped)
+    _replace_with_link(latest, timestamped)
     return latest
 
 
+@functools.lru_cache(maxsize=1)
+def _workspace_opener():
+    try:
+        from AppKit import NSWorkspace
+        from Foundation import NSURL
+    except ImportError:
+        return None
+    workspace = NSWorkspace.sharedWorkspace()
+    return lambda path: workspace.openURL_(NSURL.fileURLWithPath_(path))
+
+
 def _open_report(path: pathlib.Path) -> None:
+    opener = _workspace_opener()
+    if opener is not None:
+        opener(str(path))
+        return
     if shutil.which("open") is None:
         return
     subprocess.run(["open", str(path)], capture_output=True, text=True)
 
 
 def open_update_report_if_needed(config: Config, summary: dict) -> pathlib.Path | None:
-    updates = _updates_for_machine(summary, config.machine_name)
-    if not updates:
+    if not _has_updates_for_machine(summary, config.machine_name):
         return None
     report_path = write_update_report(config.expanded_reports_path(), summary, config.machine_name)
     _open_report(report_path)
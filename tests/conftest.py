@@ -1,16 +1,71 @@
 from __future__ import annotations
 
+import dataclasses
+import os
 import pathlib
+import re
+import tempfile
 
 import pytest
 
 from pt_plugin_sync import config as config_module
+from pt_plugin_sync.config import Config
+
+_DEFAULT_DESCRIPTION = "Test module executed."
+_MODULE_DESCRIPTIONS: dict[str, str] = {
+    "tests/test_auto_update.py": "App bundle discovery for self-updates.",
+    "tests/test_cli.py": "CLI commands: setup, scan, diff, and Dropbox auth flows.",
+    "tests/test_combined_report.py": "Combined HTML report sections.",
+    "tests/test_config.py": "Config defaults, validation, and read/write round-trips.",
+    "tests/test_config_setup.py": "Setup flows and ensure_config error handling.",
+    "tests/test_daemon.py": "Daemon debounce logic and scan triggering.",
+    "tests/test_diffing.py": "Diff generation, summaries, and report loading/writing.",
+    "tests/test_dropbox_auth.py": "Dropbox OAuth flow success and error paths.",
+    "tests/test_dropbox_store.py": "Dropbox report store path handling and uploads.",
+    "tests/test_launchd.py": "LaunchAgent plist generation and uninstall behavior.",
+    "tests/test_menubar.py": "Menu bar actions, UI state changes, and update checks.",
+    "tests/test_report_naming.py": "Report filename classification logic.",
+    "tests/test_report_store.py": "Local report store read/write integration.",
+    "tests/test_reporting.py": "Report generation, writing, and pruning.",
+    "tests/test_scan_cycle.py": "End-to-end scan cycle writes outputs.",
+    "tests/test_scanner.py": "Plugin scanning metadata and hashing.",
+    "tests/test_settings_server.py": "Settings web UI saves and Dropbox auth flow.",
+    "tests/test_settings_window.py": "Settings window controller smoke test (stubbed).",
+    "tests/test_update_check.py": "Update check parsing and comparison logic.",
+    "tests/test_update_report.py": "HTML update report content and opening behavior.",
+}
+
+_BASE_CONFIG = Config(machine_name="Studio", plugins_path="", reports_path="", reports_backend="local")
+
+
+def _mkdirs(*paths: pathlib.Path) -> None:
+    for path in paths:
+        os.makedirs(path, exist_ok=True)
+
+
+@pytest.fixture
+def mkdirs():
+    return _mkdirs
+
+
+@pytest.fixture
+def make_config():
+    return lambda **overrides: dataclasses.replace(_BASE_CONFIG, **overrides)
+
+
+@pytest.fixture(scope="session")
+def _config_root(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    return tmp_path_factory.mktemp("cfg_root")
 
 
 @pytest.fixture
-def temp_config_dir(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
+def temp_config_dir(
+    _config_root: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    request: pytest.FixtureRequest,
+):
+    prefix = re.sub(r"\W", "_", request.node.name)[:30]
+    config_dir = pathlib.Path(tempfile.mkdtemp(prefix=prefix, dir=_config_root))
     config_path = config_dir / "config.toml"
     monkeypatch.setattr(config_module, "CONFIG_DIR", config_dir)
     monkeypatch.setattr(config_module, "CONFIG_PATH", config_path)
@@ -21,30 +76,13 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
     if exitstatus != 0:
         return
     modules = sorted(
-        {report.nodeid.split("::", 1)[0] for report in terminalreporter.stats.get("passed", [])}
+        {report.nodeid.partition("::")[0] for report in terminalreporter.stats.get("passed", ())}
     )
-    descriptions = {
-        "tests/test_cli.py": "CLI commands: setup, scan, diff, and Dropbox auth flows.",
-        "tests/test_config.py": "Config defaults, validation, and read/write round-trips.",
-        "tests/test_config_setup.py": "Setup flows and ensure_config error handling.",
-        "tests/test_daemon.py": "Daemon debounce logic and scan triggering.",
-        "tests/test_diffing.py": "Diff generation, summaries, and report loading/writing.",
-        "tests/test_dropbox_auth.py": "Dropbox OAuth flow success and error paths.",
-        "tests/test_dropbox_store.py": "Dropbox report store path handling and uploads.",
-        "tests/test_launchd.py": "LaunchAgent plist generation and uninstall behavior.",
-        "tests/test_menubar.py": "Menu bar actions, UI state changes, and update checks.",
-        "tests/test_report_naming.py": "Report filename classification logic.",
-        "tests/test_report_store.py": "Local report store read/write integration.",
-        "tests/test_reporting.py": "Report generation, writing, and pruning.",
-        "tests/test_scan_cycle.py": "End-to-end scan cycle writes outputs.",
-        "tests/test_scanner.py": "Plugin scanning metadata and hashing.",
-        "tests/test_settings_server.py": "Settings web UI saves and Dropbox auth flow.",
-        "tests/test_settings_window.py": "Settings window controller smoke test (stubbed).",
-        "tests/test_update_check.py": "Update check parsing and comparison logic.",
-        "tests/test_update_report.py": "HTML update report content and opening behavior.",
-    }
     terminalreporter.write_line("")
     terminalreporter.write_line("Test coverage summary:")
     for module in modules:
-        description = descriptions.get(module, "Test module executed.")
+        try:
+            description = _MODULE_DESCRIPTIONS[module]
+        except KeyError:
+            description = _DEFAULT_DESCRIPTION
         terminalreporter.write_line(f"- {module}: {description}")
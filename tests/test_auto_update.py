@@ -9,7 +9,7 @@ def test_find_app_bundle_walks_parents(tmp_path) -> None:
     app_root = tmp_path / "Pro Tools Plugin Sync.app"
     exe_path = app_root / "Contents" / "MacOS" / "Pro Tools Plugin Sync"
     exe_path.parent.mkdir(parents=True)
-    exe_path.write_text("", encoding="utf-8")
+    exe_path.touch()
     found = find_app_bundle(str(exe_path))
     assert found == app_root
 
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import pytest
+
 from pt_plugin_sync import cli as cli_module
 from pt_plugin_sync.config import Config
 
 
-def test_setup_command_calls_run_setup(monkeypatch) -> None:
+@pytest.fixture(scope="session")
+def cli_parser():
+    return cli_module.build_parser()
+
+
+def _patch(monkeypatch, **attrs) -> None:
+    for name, value in attrs.items():
+        monkeypatch.setattr(cli_module, name, value)
+
+
+def test_setup_command_calls_run_setup(cli_parser, monkeypatch) -> None:
     captured = {}
 
     def fake_run_setup(**kwargs):
         captured.update(kwargs)
 
     monkeypatch.setattr(cli_module, "run_setup", fake_run_setup)
-    parser = cli_module.build_parser()
-    args = parser.parse_args(
+    args = cli_parser.parse_args(
         [
             "setup",
             "--plugins-path",
@@ -31,18 +42,17 @@ def test_setup_command_calls_run_setup(monkeypatch) -> None:
     assert captured["machine_name"] == "Studio"
 
 
-def test_setup_command_handles_validation_error(monkeypatch, capsys) -> None:
+def test_setup_command_handles_validation_error(cli_parser, monkeypatch, capsys) -> None:
     def fake_run_setup(**_kwargs):
         raise ValueError("bad input")
 
     monkeypatch.setattr(cli_module, "run_setup", fake_run_setup)
-    parser = cli_module.build_parser()
-    args = parser.parse_args(["setup"])
+    args = cli_parser.parse_args(["setup"])
     assert cli_module._cmd_setup(args) == 1
     assert "Setup failed: bad input" in capsys.readouterr().out
 
 
-def test_scan_command_calls_perform_scan(monkeypatch) -> None:
+def test_scan_command_calls_perform_scan(cli_parser, monkeypatch) -> None:
     class Result:
         diff = None
 
@@ -53,38 +63,56 @@ def test_scan_command_calls_perform_scan(monkeypatch) -> None:
         called["open_report"] = open_report
         return Result()
 
-    monkeypatch.setattr(cli_module, "ensure_config", lambda interactive=True: "config")
-    monkeypatch.setattr(cli_module, "perform_scan", fake_perform_scan)
-    args = cli_module.build_parser().parse_args(["scan"])
+    _patch(
+        monkeypatch,
+        ensure_config=lambda interactive=True: "config",
+        perform_scan=fake_perform_scan,
+    )
+    args = cli_parser.parse_args(["scan"])
     assert cli_module._cmd_scan(args) == 0
     assert called["config"] == "config"
     assert called["open_report"] is True
 
 
-def test_diff_command_no_reports(monkeypatch, capsys) -> None:
+def test_scan_command_reports_scan_in_progress(cli_parser, monkeypatch, capsys) -> None:
+    def busy_scan(_config, open_report):
+        raise cli_module.ScanInProgressError("A scan is already running.")
+
+    _patch(
+        monkeypatch,
+        ensure_config=lambda interactive=True: "config",
+        perform_scan=busy_scan,
+    )
+    args = cli_parser.parse_args(["scan"])
+    assert cli_module._cmd_scan(args) == 1
+    assert "Scan skipped: A scan is already running." in capsys.readouterr().out
+
+def test_diff_command_no_reports(cli_parser, monkeypatch, capsys) -> None:
     class Store:
         def load_latest_reports(self):
             return {}
 
-    monkeypatch.setattr(cli_module, "ensure_config", lambda interactive=True: "config")
-    monkeypatch.setattr(cli_module, "report_store_from_config", lambda _cfg: Store())
-    args = cli_module.build_parser().parse_args(["diff"])
+    _patch(
+        monkeypatch,
+        ensure_config=lambda interactive=True: "config",
+        report_store_from_config=lambda _cfg: Store(),
+    )
+    args = cli_parser.parse_args(["diff"])
     assert cli_module._cmd_diff(args) == 1
     assert "No reports found in reports folder." in capsys.readouterr().out
 
 
-def test_dropbox_auth_requires_config(monkeypatch, capsys) -> None:
+def test_dropbox_auth_requires_config(cli_parser, monkeypatch, capsys) -> None:
     monkeypatch.setattr(cli_module, "load_config", lambda: None)
-    args = cli_module.build_parser().parse_args(["dropbox-auth"])
+    args = cli_parser.parse_args(["dropbox-auth"])
     assert cli_module._cmd_dropbox_auth(args) == 1
     assert "Config missing" in capsys.readouterr().out
 
 
-def test_dropbox_auth_writes_refresh_token(monkeypatch, tmp_path) -> None:
+def test_dropbox_auth_writes_refresh_token(cli_parser, monkeypatch, tmp_path, mkdirs) -> None:
     plugins_dir = tmp_path / "plugins"
     reports_dir = tmp_path / "reports"
-    plugins_dir.mkdir()
-    reports_dir.mkdir()
+    mkdirs(plugins_dir, reports_dir)
     config = Config(
         machine_name="Studio",
         plugins_path=str(plugins_dir),
@@ -95,14 +123,16 @@ def test_dropbox_auth_writes_refresh_token(monkeypatch, tmp_path) -> None:
     )
     captured: dict[str, Config] = {}
 
-    monkeypatch.setattr(cli_module, "load_config", lambda: config)
-    monkeypatch.setattr(cli_module, "run_dropbox_oauth", lambda *_: "refresh-token")
-
     def fake_write_config(updated: Config) -> None:
         captured["config"] = updated
 
-    monkeypatch.setattr(cli_module, "write_config", fake_write_config)
-    args = cli_module.build_parser().parse_args(["dropbox-auth"])
+    _patch(
+        monkeypatch,
+        load_config=lambda: config,
+        run_dropbox_oauth=lambda *_: "refresh-token",
+        write_config=fake_write_config,
+    )
+    args = cli_parser.parse_args(["dropbox-auth"])
     assert cli_module._cmd_dropbox_auth(args) == 0
     saved = captured["config"]
     assert saved.dropbox_refresh_token == "refresh-token"
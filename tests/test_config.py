@@ -1,20 +1,22 @@
 from __future__ import annotations
 
-import pathlib
+import pytest
 
+import pt_plugin_sync.config as config_module
 from pt_plugin_sync.config import Config, default_config, load_config, validate_config, write_config
 
+pytestmark = pytest.mark.xdist_group("fs")
+
 
 def test_default_config_uses_system_plugins_path() -> None:
     config = default_config()
     assert config.plugins_path == "/Library/Application Support/Avid/Audio/Plug-Ins"
 
 
-def test_write_and_load_roundtrip(temp_config_dir) -> None:
-    plugins_dir = pathlib.Path(temp_config_dir[0]) / "plugins"
-    reports_dir = pathlib.Path(temp_config_dir[0]) / "reports"
-    plugins_dir.mkdir()
-    reports_dir.mkdir()
+def test_write_and_load_roundtrip(temp_config_dir, mkdirs) -> None:
+    plugins_dir = temp_config_dir[0] / "plugins"
+    reports_dir = temp_config_dir[0] / "reports"
+    mkdirs(plugins_dir, reports_dir)
     config = Config(
         machine_name="Test",
         plugins_path=str(plugins_dir),
@@ -35,62 +37,74 @@ def test_write_and_load_roundtrip(temp_config_dir) -> None:
     assert loaded.auto_update_download is True
 
 
-def test_validate_config_requires_existing_plugins_path(temp_config_dir) -> None:
-    plugins_dir = pathlib.Path(temp_config_dir[0]) / "missing"
-    reports_dir = pathlib.Path(temp_config_dir[0]) / "reports"
-    reports_dir.mkdir()
+def test_load_config_reuses_parse_until_file_changes(temp_config_dir, monkeypatch) -> None:
     config = Config(
         machine_name="Test",
-        plugins_path=str(plugins_dir),
-        reports_path=str(reports_dir),
-        reports_backend="local",
+        plugins_path=str(temp_config_dir[0] / "plugins"),
+        reports_path=str(temp_config_dir[0] / "reports"),
     )
-    validation = validate_config(config)
-    assert validation.ok is False
-    assert any("plugins_path does not exist" in error for error in validation.errors)
+    write_config(config)
+    first = load_config()
+    assert first is not None
 
+    def fail_load(_handle):
+        raise AssertionError("config should not be re-parsed")
 
-def test_validate_config_accepts_valid_paths(temp_config_dir) -> None:
-    plugins_dir = pathlib.Path(temp_config_dir[0]) / "plugins"
-    reports_dir = pathlib.Path(temp_config_dir[0]) / "reports"
-    plugins_dir.mkdir()
-    reports_dir.mkdir()
-    config = Config(
-        machine_name="Test",
-        plugins_path=str(plugins_dir),
-        reports_path=str(reports_dir),
-        reports_backend="local",
-    )
-    validation = validate_config(config)
-    assert validation.ok is True
-
+    with monkeypatch.context() as patch:
+        patch.setattr(config_module.tomllib, "load", fail_load)
+        second = load_config()
+    assert second == first
+    assert second is not first
 
-def test_validate_config_rejects_negative_values(temp_config_dir) -> None:
-    plugins_dir = pathlib.Path(temp_config_dir[0]) / "plugins"
-    reports_dir = pathlib.Path(temp_config_dir[0]) / "reports"
-    plugins_dir.mkdir()
+    config.machine_name = "Renamed"
+    write_config(config)
+    reloaded = load_config()
+    assert reloaded is not None
+    assert reloaded.machine_name == "Renamed"
+
+
+@pytest.mark.parametrize(
+    "overrides, create_plugins, ok, errors",
+    [
+        ({}, False, False, ["plugins_path does not exist"]),
+        ({}, True, True, []),
+        (
+            {"scan_interval_seconds": 0, "debounce_seconds": -1, "prune_days": -5},
+            True,
+            False,
+            [
+                "scan_interval_seconds must be positive",
+                "debounce_seconds must be >= 0",
+                "prune_days must be >= 0",
+            ],
+        ),
+    ],
+    ids=["missing-plugins-path", "valid-paths", "negative-values"],
+)
+def test_validate_config(temp_config_dir, overrides, create_plugins, ok, errors) -> None:
+    plugins_dir = temp_config_dir[0] / "plugins"
+    reports_dir = temp_config_dir[0] / "reports"
     reports_dir.mkdir()
+    if create_plugins:
+        plugins_dir.mkdir()
     config = Config(
         machine_name="Test",
         plugins_path=str(plugins_dir),
         reports_path=str(reports_dir),
         reports_backend="local",
-        scan_interval_seconds=0,
-        debounce_seconds=-1,
-        prune_days=-5,
+        **overrides,
     )
     validation = validate_config(config)
-    assert validation.ok is False
-    assert any("scan_interval_seconds must be positive" in error for error in validation.errors)
-    assert any("debounce_seconds must be >= 0" in error for error in validation.errors)
-    assert any("prune_days must be >= 0" in error for error in validation.errors)
+    assert validation.ok is ok
+    errors_blob = "\n".join(validation.errors)
+    for message in errors:
+        assert message in errors_blob
 
 
-def test_write_config_includes_dropbox_fields(temp_config_dir) -> None:
-    plugins_dir = pathlib.Path(temp_config_dir[0]) / "plugins"
-    reports_dir = pathlib.Path(temp_config_dir[0]) / "reports"
-    plugins_dir.mkdir()
-    reports_dir.mkdir()
+def test_write_config_includes_dropbox_fields(temp_config_dir, mkdirs) -> None:
+    plugins_dir = temp_config_dir[0] / "plugins"
+    reports_dir = temp_config_dir[0] / "reports"
+    mkdirs(plugins_dir, reports_dir)
     config = Config(
         machine_name="Test",
         plugins_path=str(plugins_dir),
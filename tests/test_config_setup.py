@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import pathlib
-
 import pytest
 
-from pt_plugin_sync.config import Config, ensure_config, run_setup, write_config
+from pt_plugin_sync.config import ensure_config, run_setup, write_config
+
+pytestmark = pytest.mark.xdist_group("fs")
 
 
 def test_run_setup_yes_creates_reports_dir(temp_config_dir, tmp_path) -> None:
@@ -45,12 +45,10 @@ def test_ensure_config_missing_non_interactive_raises(temp_config_dir) -> None:
         ensure_config(interactive=False)
 
 
-def test_ensure_config_invalid_non_interactive_raises(temp_config_dir, tmp_path) -> None:
-    config = Config(
-        machine_name="Studio",
+def test_ensure_config_invalid_non_interactive_raises(temp_config_dir, tmp_path, make_config) -> None:
+    config = make_config(
         plugins_path=str(tmp_path / "missing"),
         reports_path=str(tmp_path / "reports"),
-        reports_backend="local",
     )
     write_config(config)
     with pytest.raises(RuntimeError, match="Invalid config"):
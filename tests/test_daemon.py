@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import sys
 import threading
-
-import builtins
 import types
 
+import pytest
+
 from pt_plugin_sync import daemon as daemon_module
-from pt_plugin_sync.config import Config
+
+pytestmark = pytest.mark.xdist_group("fs")
 
 
 def test_debounced_runner_triggers_action(monkeypatch) -> None:
@@ -23,18 +25,18 @@ def test_debounced_runner_triggers_action(monkeypatch) -> None:
         def cancel(self):
             return None
 
-    monkeypatch.setattr(daemon_module.threading, "Timer", FakeTimer)
+    monkeypatch.setattr(
+        daemon_module.DebouncedRunner, "_make_timer", lambda runner: FakeTimer(1, runner._action)
+    )
     runner = daemon_module.DebouncedRunner(1, lambda: calls.append("run"))
     runner.trigger()
     assert calls == ["run"]
 
 
-def test_perform_scan_handles_pending(monkeypatch, tmp_path, capsys) -> None:
-    config = Config(
-        machine_name="Studio",
+def test_perform_scan_handles_pending(monkeypatch, tmp_path, capsys, make_config) -> None:
+    config = make_config(
         plugins_path=str(tmp_path / "plugins"),
         reports_path=str(tmp_path / "reports"),
-        reports_backend="local",
     )
     scan_lock = threading.Lock()
     pending = {"scan": False}
@@ -63,18 +65,23 @@ def test_debounced_runner_cancel(monkeypatch) -> None:
         def cancel(self):
             self._cancelled = True
 
-    monkeypatch.setattr(daemon_module.threading, "Timer", FakeTimer)
+    timers = []
+
+    def make_timer(runner):
+        timers.append(FakeTimer(1, runner._action))
+        return timers[-1]
+
+    monkeypatch.setattr(daemon_module.DebouncedRunner, "_make_timer", make_timer)
     runner = daemon_module.DebouncedRunner(1, lambda: None)
     runner.trigger()
     runner.cancel()
+    assert timers[0]._cancelled is True
 
 
-def test_run_daemon_fallback_without_watchdog(monkeypatch, tmp_path, capsys) -> None:
-    config = Config(
-        machine_name="Studio",
+def test_run_daemon_fallback_without_watchdog(monkeypatch, tmp_path, capsys, make_config) -> None:
+    config = make_config(
         plugins_path=str(tmp_path / "plugins"),
         reports_path=str(tmp_path / "reports"),
-        reports_backend="local",
         scan_interval_seconds=1,
     )
     calls = []
@@ -85,13 +92,19 @@ def test_run_daemon_fallback_without_watchdog(monkeypatch, tmp_path, capsys) ->
 
     monkeypatch.setattr(daemon_module, "perform_scan", fake_scan)
     monkeypatch.setattr(daemon_module, "time", types.SimpleNamespace(time=lambda: 0, sleep=lambda _s: (_ for _ in ()).throw(KeyboardInterrupt())))
-
-    def fake_import(name, *args, **kwargs):
-        if name.startswith("watchdog"):
-            raise ImportError("no watchdog")
-        return builtins.__import__(name, *args, **kwargs)
-
-    monkeypatch.setattr(builtins, "__import__", fake_import)
+    for name in ("watchdog", "watchdog.events", "watchdog.observers"):
+        monkeypatch.setitem(sys.modules, name, None)
     daemon_module.run_daemon(config)
     output = capsys.readouterr().out
     assert "Watcher unavailable" in output
+
+
+def test_perform_scan_reports_scan_in_progress(monkeypatch, capsys, make_config) -> None:
+    def busy_scan(_config, open_report=True):
+        raise daemon_module.ScanInProgressError("A scan is already running.")
+
+    monkeypatch.setattr(daemon_module, "perform_scan", busy_scan)
+    daemon_module._perform_scan(make_config(), threading.Lock(), {"scan": False})
+    output = capsys.readouterr().out
+    assert "Scan skipped: A scan is already running." in output
+    assert "Scan failed" not in output
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from pt_plugin_sync.diffing import (
     _version_key,
     _version_label,
@@ -13,6 +15,8 @@ from pt_plugin_sync.diffing import (
     write_summary,
 )
 
+pytestmark = pytest.mark.xdist_group("fs")
+
 
 def _report(machine: str, plugins: list[dict]) -> dict:
     return {"machine_name": machine, "plugins": plugins}
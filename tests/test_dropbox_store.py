@@ -1,22 +1,118 @@
 from __future__ import annotations
 
+import types
+
+import pytest
+
 from pt_plugin_sync import dropbox_store as dropbox_store_module
 from pt_plugin_sync.config import Config
 from pt_plugin_sync.dropbox_store import DropboxReportStore
 
 
+class FakeFileMetadata:
+    def __init__(self, name, path_lower=None, client_modified=None):
+        self.name = name
+        self.path_lower = path_lower or f"/reports/{name}"
+        self.client_modified = client_modified
+
+
+class FakeResult:
+    def __init__(self, entries, has_more, cursor):
+        self.entries = entries
+        self.has_more = has_more
+        self.cursor = cursor
+
+
+class FakeBatchOutcome:
+    def __init__(self, failed):
+        self._failed = failed
+
+    def is_failure(self):
+        return self._failed
+
+
+class FakeBatchStatus:
+    def __init__(self, job_id=None, entries=None):
+        self._job_id = job_id
+        self._entries = entries
+
+    def is_complete(self):
+        return self._entries is not None
+
+    def get_complete(self):
+        return types.SimpleNamespace(entries=self._entries)
+
+    def is_async_job_id(self):
+        return self._job_id is not None
+
+    def get_async_job_id(self):
+        return self._job_id
+
+    def is_in_progress(self):
+        return self._entries is None
+
+    def is_failed(self):
+        return False
+
+
+class FakeDropboxClient:
+    def __init__(self, pages=(), content=b"", delete_failures=()):
+        self.uploads = []
+        self.deleted = []
+        self.batch_checks = []
+        self._delete_failures = set(delete_failures)
+        self._batches = {}
+        self.created_folders = []
+        self.list_limit = None
+        self._pages = iter(pages)
+        self._content = content
+
+    def files_upload(self, data, path, mode=None):
+        self.uploads.append((path, data))
+
+    def files_delete_batch(self, entries):
+        paths = [entry.path for entry in entries]
+        self.deleted.append(paths)
+        job_id = f"job-{len(self.deleted)}"
+        self._batches[job_id] = [FakeBatchOutcome(path in self._delete_failures) for path in paths]
+        return FakeBatchStatus(job_id=job_id)
+
+    def files_delete_batch_check(self, job_id):
+        self.batch_checks.append(job_id)
+        if self.batch_checks.count(job_id) == 1:
+            return FakeBatchStatus()
+        return FakeBatchStatus(entries=self._batches[job_id])
+
+    def files_list_folder(self, _path, limit=None):
+        self.list_limit = limit
+        return next(self._pages)
+
+    def files_list_folder_continue(self, _cursor):
+        return next(self._pages)
+
+    def files_download(self, _path):
+        return None, types.SimpleNamespace(content=self._content)
+
+    def files_get_metadata(self, _path):
+        raise dropbox_store_module.dropbox.exceptions.ApiError("id", "not found", None)
+
+    def files_create_folder_v2(self, path):
+        self.created_folders.append(path)
+
+
+@pytest.fixture(scope="module")
+def fake_client_factory():
+    return FakeDropboxClient
+
+
 def test_normalize_dropbox_path() -> None:
     assert dropbox_store_module._normalize_dropbox_path("Reports") == "/Reports"
     assert dropbox_store_module._normalize_dropbox_path("/Reports/") == "/Reports"
 
 
 def test_normalize_dropbox_path_rejects_empty() -> None:
-    try:
+    with pytest.raises(ValueError, match="Dropbox reports path is required."):
         dropbox_store_module._normalize_dropbox_path("  ")
-    except ValueError as exc:
-        assert "Dropbox reports path is required." in str(exc)
-    else:
-        raise AssertionError("Expected ValueError for empty path")
 
 
 def test_from_config_requires_tokens() -> None:
@@ -26,54 +122,36 @@ def test_from_config_requires_tokens() -> None:
         reports_path="/Reports",
         reports_backend="dropbox",
     )
-    try:
+    with pytest.raises(ValueError, match="Dropbox app key/secret missing"):
         DropboxReportStore.from_config(config)
-    except ValueError as exc:
-        assert "Dropbox app key/secret missing" in str(exc)
-    else:
-        raise AssertionError("Expected ValueError for missing Dropbox credentials")
-
-
-def test_write_report_uploads_payload(monkeypatch, tmp_path) -> None:
-    uploads = []
 
-    class FakeClient:
-        def files_upload(self, data, path, mode=None):
-            uploads.append((path, data))
 
-    store = DropboxReportStore(client=FakeClient(), reports_path="/Reports")
+def test_write_report_uploads_payload(monkeypatch, tmp_path, fake_client_factory) -> None:
+    client = fake_client_factory()
+    store = DropboxReportStore(client=client, reports_path="/Reports")
     monkeypatch.setattr(store, "_archive_old_scans", lambda: None)
     store.write_report({"machine_name": "Studio", "plugins": []})
-    assert any(path.endswith("__latest.json") for path, _ in uploads)
+    assert any(path.endswith("__latest.json") for path, _ in client.uploads)
 
 
-def test_write_combined_report_uploads_html_and_json() -> None:
-    uploads = []
-
-    class FakeClient:
-        def files_upload(self, data, path, mode=None):
-            uploads.append(path)
-
-    store = DropboxReportStore(client=FakeClient(), reports_path="/Reports")
+def test_write_combined_report_uploads_html_and_json(fake_client_factory) -> None:
+    client = fake_client_factory()
+    store = DropboxReportStore(client=client, reports_path="/Reports")
     reports = {"Studio": {"machine_name": "Studio", "plugins": []}}
     summary = {"updates_by_machine": {"Studio": []}}
     diff = {"generated_at": "2024-01-01T00:00:00Z"}
     store.write_combined_report(reports, summary, diff)
+    uploads = [path for path, _ in client.uploads]
     assert any(path.endswith("report__latest.html") for path in uploads)
     assert any(path.endswith("report__latest.json") for path in uploads)
 
 
-def test_dropbox_prune_reports_skips_when_disabled(monkeypatch) -> None:
-    calls = []
-
-    class FakeClient:
-        def files_delete_v2(self, _path):
-            calls.append(_path)
-
-    store = DropboxReportStore(client=FakeClient(), reports_path="/Reports")
+def test_dropbox_prune_reports_skips_when_disabled(monkeypatch, fake_client_factory) -> None:
+    client = fake_client_factory()
+    store = DropboxReportStore(client=client, reports_path="/Reports")
     monkeypatch.setattr(store, "_list_files_in", lambda _path: [])
     store.prune_reports(prune_days=0)
-    assert calls == []
+    assert client.deleted == []
 
 
 def test_archive_path_builds_subdir() -> None:
@@ -81,47 +159,22 @@ def test_archive_path_builds_subdir() -> None:
     assert store._archive_path("file.json") == "old scans/file.json"
 
 
-def test_list_files_in_handles_pagination(monkeypatch) -> None:
-    class FakeFileMetadata:
-        def __init__(self, name, path_lower=None):
-            self.name = name
-            self.path_lower = path_lower or f"/reports/{name}"
-
-    class FakeResult:
-        def __init__(self, entries, has_more, cursor):
-            self.entries = entries
-            self.has_more = has_more
-            self.cursor = cursor
-
-    class FakeClient:
-        def __init__(self):
-            self.calls = 0
-
-        def files_list_folder(self, _path):
-            return FakeResult([FakeFileMetadata("a.json"), object()], True, "cursor")
-
-        def files_list_folder_continue(self, _cursor):
-            return FakeResult([FakeFileMetadata("b.json")], False, "")
-
-    store = DropboxReportStore(client=FakeClient(), reports_path="/Reports")
+def test_list_files_in_handles_pagination(monkeypatch, fake_client_factory) -> None:
+    client = fake_client_factory(
+        pages=[
+            FakeResult([FakeFileMetadata("a.json"), object()], True, "cursor"),
+            FakeResult([FakeFileMetadata("b.json")], False, ""),
+        ]
+    )
+    store = DropboxReportStore(client=client, reports_path="/Reports")
     monkeypatch.setattr(dropbox_store_module.dropbox.files, "FileMetadata", FakeFileMetadata)
     names = [entry.name for entry in store._list_files_in("/Reports")]
     assert names == ["a.json", "b.json"]
+    assert client.list_limit == 2000
 
 
-def test_prune_reports_deletes_old_entries(monkeypatch) -> None:
-    deleted = []
-
-    class FakeEntry:
-        def __init__(self, name, client_modified):
-            self.name = name
-            self.client_modified = client_modified
-            self.path_lower = f"/reports/{name}"
-
-    class FakeClient:
-        def files_delete_v2(self, path):
-            deleted.append(path)
-
+def test_prune_reports_deletes_old_entries(monkeypatch, fake_client_factory) -> None:
+    client = fake_client_factory()
     fixed_now = dropbox_store_module.datetime(2024, 1, 10, tzinfo=dropbox_store_module.timezone.utc)
     old = fixed_now - dropbox_store_module.timedelta(days=3)
     recent = fixed_now
@@ -131,50 +184,63 @@ def test_prune_reports_deletes_old_entries(monkeypatch) -> None:
         def now(tz=None):
             return fixed_now
 
-    store = DropboxReportStore(client=FakeClient(), reports_path="/Reports")
+    store = DropboxReportStore(client=client, reports_path="/Reports")
     monkeypatch.setattr(dropbox_store_module, "datetime", FakeDatetime)
+    monkeypatch.setattr(dropbox_store_module, "time", types.SimpleNamespace(sleep=lambda _s: None))
 
     def fake_list(path):
         if "old scans" in path:
-            return [FakeEntry("Studio__20240101-000000.json", old)]
+            return [FakeFileMetadata("Studio__20240101-000000.json", client_modified=old)]
         return [
-            FakeEntry("Studio__20240102-000000.json", old),
-            FakeEntry("Studio__latest.json", recent),
+            FakeFileMetadata("Studio__20240102-000000.json", client_modified=old),
+            FakeFileMetadata("Studio__latest.json", client_modified=recent),
         ]
 
     monkeypatch.setattr(store, "_list_files_in", fake_list)
     store.prune_reports(prune_days=1)
-    assert "/reports/Studio__20240102-000000.json" in deleted
-    assert "/reports/Studio__20240101-000000.json" in deleted
+    assert client.deleted == [
+        ["/reports/Studio__20240102-000000.json", "/reports/Studio__20240101-000000.json"]
+    ]
+    assert client.batch_checks == ["job-1", "job-1"]
+
 
+def test_prune_reports_raises_on_failed_deletes(monkeypatch, fake_client_factory) -> None:
+    client = fake_client_factory(delete_failures=["/reports/Studio__20240101-000000.json"])
+    fixed_now = dropbox_store_module.datetime(2024, 1, 10, tzinfo=dropbox_store_module.timezone.utc)
+    old = fixed_now - dropbox_store_module.timedelta(days=3)
 
-def test_download_json_handles_invalid_json(monkeypatch) -> None:
-    class FakeResponse:
-        content = b"not-json"
+    class FakeDatetime:
+        @staticmethod
+        def now(tz=None):
+            return fixed_now
 
-    class FakeClient:
-        def files_download(self, _path):
-            return None, FakeResponse()
+    store = DropboxReportStore(client=client, reports_path="/Reports")
+    monkeypatch.setattr(dropbox_store_module, "datetime", FakeDatetime)
+    monkeypatch.setattr(dropbox_store_module, "time", types.SimpleNamespace(sleep=lambda _s: None))
 
-    store = DropboxReportStore(client=FakeClient(), reports_path="/Reports")
-    result = store._download_json("/Reports/file.json")
-    assert result is None
+    def fake_list(path):
+        if "old scans" in path:
+            return [FakeFileMetadata("Studio__20240101-000000.json", client_modified=old)]
+        return [FakeFileMetadata("Studio__20240102-000000.json", client_modified=old)]
 
+    monkeypatch.setattr(store, "_list_files_in", fake_list)
+    with pytest.raises(RuntimeError, match="Studio__20240101-000000.json"):
+        store.prune_reports(prune_days=1)
 
-def test_ensure_folder_creates_when_missing(monkeypatch) -> None:
-    calls = []
 
-    class FakeClient:
-        def files_get_metadata(self, _path):
-            raise dropbox_store_module.dropbox.exceptions.ApiError("id", "not found", None)
+def test_download_json_handles_invalid_json(monkeypatch, fake_client_factory) -> None:
+    store = DropboxReportStore(client=fake_client_factory(content=b"not-json"), reports_path="/Reports")
+    result = store._download_json("/Reports/file.json")
+    assert result is None
+
 
-        def files_create_folder_v2(self, path):
-            calls.append(path)
+def test_ensure_folder_creates_when_missing(monkeypatch, fake_client_factory) -> None:
+    client = fake_client_factory()
 
     class FakeApiError(Exception):
         pass
 
     monkeypatch.setattr(dropbox_store_module.dropbox.exceptions, "ApiError", FakeApiError)
-    store = DropboxReportStore(client=FakeClient(), reports_path="/Reports")
+    store = DropboxReportStore(client=client, reports_path="/Reports")
     store._ensure_folder()
-    assert calls == ["/Reports"]
+    assert client.created_folders == ["/Reports"]
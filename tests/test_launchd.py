@@ -1,29 +1,32 @@
 from __future__ import annotations
 
-import pathlib
 import plistlib
 import sys
 
+import pytest
+
 from pt_plugin_sync.config import Config
 from pt_plugin_sync import launchd as launchd_module
 
 
-def _config(tmp_path: pathlib.Path) -> Config:
+@pytest.fixture(scope="module")
+def base_config(tmp_path_factory: pytest.TempPathFactory) -> Config:
+    root = tmp_path_factory.mktemp("launchd")
     return Config(
         machine_name="Studio",
-        plugins_path=str(tmp_path / "plugins"),
-        reports_path=str(tmp_path / "reports"),
+        plugins_path=str(root / "plugins"),
+        reports_path=str(root / "reports"),
         reports_backend="local",
     )
 
 
-def test_write_plist_creates_expected_plist(tmp_path, monkeypatch) -> None:
+def test_write_plist_creates_expected_plist(tmp_path, monkeypatch, base_config) -> None:
     plist_path = tmp_path / "agent.plist"
     log_dir = tmp_path / "logs"
     monkeypatch.setattr(launchd_module, "PLIST_PATH", plist_path)
     monkeypatch.setattr(launchd_module, "LOG_DIR", log_dir)
 
-    path = launchd_module.write_plist(_config(tmp_path))
+    path = launchd_module.write_plist(base_config)
     assert path == plist_path
     assert plist_path.exists()
     data = plistlib.loads(plist_path.read_bytes())
@@ -31,13 +34,13 @@ def test_write_plist_creates_expected_plist(tmp_path, monkeypatch) -> None:
     assert data["Label"] == "com.eric.pt-plugin-sync"
 
 
-def test_write_menubar_plist_creates_expected_plist(tmp_path, monkeypatch) -> None:
+def test_write_menubar_plist_creates_expected_plist(tmp_path, monkeypatch, base_config) -> None:
     plist_path = tmp_path / "menubar.plist"
     log_dir = tmp_path / "logs"
     monkeypatch.setattr(launchd_module, "MENUBAR_PLIST_PATH", plist_path)
     monkeypatch.setattr(launchd_module, "LOG_DIR", log_dir)
 
-    path = launchd_module.write_menubar_plist(_config(tmp_path))
+    path = launchd_module.write_menubar_plist(base_config)
     assert path == plist_path
     data = plistlib.loads(plist_path.read_bytes())
     assert data["ProgramArguments"][0] == sys.executable
@@ -60,7 +63,7 @@ def test_uninstall_launchagent_removes_plist(tmp_path, monkeypatch, capsys) -> N
     assert "LaunchAgent removed." in capsys.readouterr().out
 
 
-def test_install_launchagent_calls_launchctl(tmp_path, monkeypatch, capsys) -> None:
+def test_install_launchagent_calls_launchctl(tmp_path, monkeypatch, capsys, base_config) -> None:
     plist_path = tmp_path / "agent.plist"
     log_dir = tmp_path / "logs"
     monkeypatch.setattr(launchd_module, "PLIST_PATH", plist_path)
@@ -75,5 +78,5 @@ def test_install_launchagent_calls_launchctl(tmp_path, monkeypatch, capsys) -> N
         )
 
     monkeypatch.setattr(launchd_module, "_launchctl", fake_launchctl)
-    launchd_module.install_launchagent(_config(tmp_path))
+    launchd_module.install_launchagent(base_config)
     assert calls
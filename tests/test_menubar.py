@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib
+import pathlib
 import sys
 import types
 
@@ -68,6 +69,20 @@ def test_format_release_notes_trims(monkeypatch) -> None:
     assert trimmed.endswith("...")
 
 
+def test_resolve_icon_reuses_written_file(monkeypatch, tmp_path) -> None:
+    menubar_module = _load_menubar(monkeypatch)
+    monkeypatch.setattr(menubar_module.tempfile, "gettempdir", lambda: str(tmp_path))
+    menubar_module._resolve_icon.cache_clear()
+    first = menubar_module._resolve_icon("icons8-sync-50.png")
+    assert first is not None
+    assert pathlib.Path(first).parent == tmp_path
+    menubar_module._resolve_icon.cache_clear()
+    second = menubar_module._resolve_icon("icons8-sync-50.png")
+    assert second == first
+    assert len(list(tmp_path.iterdir())) == 1
+    menubar_module._resolve_icon.cache_clear()
+
+
 def test_latest_html_report_picks_newest(tmp_path, monkeypatch) -> None:
     menubar_module = _load_menubar(monkeypatch)
     _latest_html_report = menubar_module._latest_html_report
@@ -83,7 +98,7 @@ def test_latest_html_report_picks_newest(tmp_path, monkeypatch) -> None:
 
 def test_menu_state_updates_titles(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -99,11 +114,77 @@ def test_menu_state_updates_titles(monkeypatch, tmp_path) -> None:
     app._apply_state(menubar_module.MenuState.UPDATES)
     assert app.title == "PT!"
     assert "Updates (2)" in app._status_item.title
+    app.title = "changed elsewhere"
+    app._apply_state(menubar_module.MenuState.UPDATES)
+    assert app.title == "changed elsewhere"
+    app._last_update_count = 3
+    app._apply_state(menubar_module.MenuState.UPDATES)
+    assert "Updates (3)" in app._status_item.title
+
+
+def test_scan_requests_share_one_deadline(monkeypatch, tmp_path) -> None:
+    menubar_module = _load_menubar(monkeypatch)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
+    monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
+    monkeypatch.setattr(menubar_module, "current_version", lambda: "1.0.0")
+    config = Config(
+        machine_name="Studio",
+        plugins_path=str(tmp_path / "plugins"),
+        reports_path=str(tmp_path / "reports"),
+        reports_backend="local",
+    )
+    app = menubar_module.MenuBarApp(config)
+    app._next_scan_at = menubar_module.time.monotonic() + 3600
+    app._request_scan(60)
+    first_deadline = app._requested_scan_at
+    app._request_scan(60)
+    assert app._requested_scan_at >= first_deadline
+    app._on_scan()
+    app._request_scan(60)
+    assert app._requested_scan_at <= menubar_module.time.monotonic()
+    assert app._wait_for_scan() is True
+    assert app._requested_scan_at is None
+    app._stop_scheduler()
+    assert app._wait_for_scan() is False
+
+
+def test_scan_worker_keeps_state_when_scan_in_progress(monkeypatch, tmp_path) -> None:
+    menubar_module = _load_menubar(monkeypatch)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
+    monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
+    monkeypatch.setattr(menubar_module, "current_version", lambda: "1.0.0")
+    from pt_plugin_sync import scan_cycle as scan_cycle_module
 
+    def busy_scan(_config, open_report=True):
+        raise scan_cycle_module.ScanInProgressError("A scan is already running.")
+
+    monkeypatch.setattr(scan_cycle_module, "perform_scan", busy_scan)
+    config = Config(
+        machine_name="Studio",
+        plugins_path=str(tmp_path / "plugins"),
+        reports_path=str(tmp_path / "reports"),
+        reports_backend="local",
+    )
+    app = menubar_module.MenuBarApp(config)
+    summary = {"updates_by_machine": {"Studio": [{"key": "a"}, {"key": "b"}]}}
+    app._last_summary = summary
+    app._last_update_count = 2
+    app._last_scan_time = None
+    app._next_scan_at = menubar_module.time.monotonic() + 3600
+    app._scan_worker()
+    assert app._last_summary is summary
+    assert app._last_update_count == 2
+    assert app._last_scan_time is None
+    assert "Updates (2)" in app._status_item.title
+    assert app._requested_scan_at is not None
 
 def test_toggle_auto_update_writes_config(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -127,7 +208,7 @@ def test_toggle_auto_update_writes_config(monkeypatch, tmp_path) -> None:
 
 def test_open_reports_folder_calls_open(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -154,7 +235,7 @@ def test_open_reports_folder_calls_open(monkeypatch, tmp_path) -> None:
 
 def test_open_latest_html_alerts_when_missing(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -183,7 +264,7 @@ def test_open_latest_html_alerts_when_missing(monkeypatch, tmp_path) -> None:
 
 def test_open_latest_html_opens_when_present(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -211,7 +292,7 @@ def test_open_latest_html_opens_when_present(monkeypatch, tmp_path) -> None:
 
 def test_open_report_uses_existing_latest(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -239,7 +320,7 @@ def test_open_report_uses_existing_latest(monkeypatch, tmp_path) -> None:
 
 def test_open_report_alerts_without_summary(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -268,7 +349,7 @@ def test_open_report_alerts_without_summary(monkeypatch, tmp_path) -> None:
 
 def test_authorize_dropbox_requires_credentials(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -304,7 +385,7 @@ def test_authorize_dropbox_requires_credentials(monkeypatch, tmp_path) -> None:
 
 def test_authorize_dropbox_opens_auth_url(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -336,7 +417,7 @@ def test_authorize_dropbox_opens_auth_url(monkeypatch, tmp_path) -> None:
 
 def test_check_updates_auto_download(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -374,7 +455,7 @@ def test_check_updates_auto_download(monkeypatch, tmp_path) -> None:
 
 def test_check_updates_up_to_date_alerts(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -413,14 +494,14 @@ def test_check_updates_up_to_date_alerts(monkeypatch, tmp_path) -> None:
 
 def test_open_path_no_open_command(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.shutil, "which", lambda _name: None)
+    monkeypatch.setattr(menubar_module, "_OPEN_BIN", None)
     result = menubar_module._open_path(str(tmp_path))
     assert result is None
 
 
 def test_open_reports_folder_dropbox_alerts(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -453,7 +534,7 @@ def test_open_reports_folder_dropbox_alerts(monkeypatch, tmp_path) -> None:
 
 def test_open_latest_html_dropbox_alerts(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -486,7 +567,7 @@ def test_open_latest_html_dropbox_alerts(monkeypatch, tmp_path) -> None:
 
 def test_open_report_dropbox_alerts(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -519,7 +600,7 @@ def test_open_report_dropbox_alerts(monkeypatch, tmp_path) -> None:
 
 def test_reload_config_alerts_invalid(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -556,7 +637,7 @@ def test_reload_config_alerts_invalid(monkeypatch, tmp_path) -> None:
 
 def test_edit_config_opens_textedit(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -587,7 +668,7 @@ def test_edit_config_opens_textedit(monkeypatch, tmp_path) -> None:
 
 def test_uninstall_removes_files_and_quits(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -635,7 +716,7 @@ def test_uninstall_removes_files_and_quits(monkeypatch, tmp_path) -> None:
 
 def test_uninstall_cancel_does_not_delete(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -669,7 +750,7 @@ def test_uninstall_cancel_does_not_delete(monkeypatch, tmp_path) -> None:
 
 def test_uninstall_keeps_config_dir_when_not_empty(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
@@ -709,7 +790,7 @@ def test_uninstall_keeps_config_dir_when_not_empty(monkeypatch, tmp_path) -> Non
 
 def test_uninstall_launchagent_failure_still_cleans(monkeypatch, tmp_path) -> None:
     menubar_module = _load_menubar(monkeypatch)
-    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_timer", lambda self: None)
+    monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_scheduler", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_setup_watcher", lambda self: None)
     monkeypatch.setattr(menubar_module.MenuBarApp, "_start_update_check", lambda self: None)
     monkeypatch.setattr(menubar_module.IconAssets, "_write_resource", lambda self, name: None)
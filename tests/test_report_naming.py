@@ -11,3 +11,12 @@ def test_is_timestamped_report_filters_special_files() -> None:
     assert is_timestamped_report("notes.txt") is False
     assert is_timestamped_report(DIFF_FILENAME) is False
     assert is_timestamped_report(SUMMARY_FILENAME) is False
+
+
+def test_is_timestamped_report_edge_cases() -> None:
+    assert is_timestamped_report("Studio__Mix__20240101-120000.json") is True
+    assert is_timestamped_report("Studio__Mix__latest.json") is False
+    assert is_timestamped_report("diff__20240101-120000.json") is False
+    assert is_timestamped_report("summary__20240101-120000.json") is False
+    assert is_timestamped_report("Studio.json") is False
+    assert is_timestamped_report("Studio__20240101.json.bak") is False
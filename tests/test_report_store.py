@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import json
+
 from pt_plugin_sync.config import Config
 from pt_plugin_sync import report_store as report_store_module
+from pt_plugin_sync.report_naming import (
+    COMBINED_HTML_LATEST_FILENAME,
+    COMBINED_JSON_LATEST_FILENAME,
+    DIFF_FILENAME,
+    SUMMARY_FILENAME,
+)
 from pt_plugin_sync.report_store import LocalReportStore, report_store_from_config
 
 
@@ -50,3 +58,16 @@ def test_local_report_store_prune_calls_reporting(tmp_path, monkeypatch) -> None
     monkeypatch.setattr(report_store_module, "prune_local_reports", fake_prune)
     store.prune_reports(5)
     assert called["days"] == 5
+
+
+def test_local_report_store_write_all_writes_outputs(tmp_path) -> None:
+    reports_dir = tmp_path / "reports"
+    store = LocalReportStore(reports_dir)
+    reports = {"Studio": {"machine_name": "Studio", "plugins": []}}
+    summary = {"machines": ["Studio"], "updates_by_machine": {"Studio": []}}
+    diff = {"machines": ["Studio"]}
+    store.write_all(reports, summary, diff)
+    assert json.loads((reports_dir / DIFF_FILENAME).read_text(encoding="utf-8")) == diff
+    assert json.loads((reports_dir / SUMMARY_FILENAME).read_text(encoding="utf-8")) == summary
+    assert (reports_dir / COMBINED_HTML_LATEST_FILENAME).exists()
+    assert (reports_dir / COMBINED_JSON_LATEST_FILENAME).exists()
@@ -32,6 +32,18 @@ def test_write_report_creates_latest_and_timestamped(tmp_path) -> None:
     assert latest.exists()
     data = json.loads(latest.read_text(encoding="utf-8"))
     assert data["machine_name"] == "Studio"
+    assert latest.read_bytes() == timestamped.read_bytes()
+
+
+def test_write_report_replaces_latest_without_touching_archive(tmp_path) -> None:
+    first_timestamped, latest = write_report(tmp_path, {"machine_name": "Studio", "scan": 1})
+    first_payload = first_timestamped.read_bytes()
+    second_timestamped = first_timestamped.with_name("Studio__20000101-000000.json")
+    first_timestamped.replace(second_timestamped)
+    _, latest = write_report(tmp_path, {"machine_name": "Studio", "scan": 2})
+    assert json.loads(latest.read_text(encoding="utf-8"))["scan"] == 2
+    assert second_timestamped.read_bytes() == first_payload
+    assert not list(tmp_path.glob(".*.tmp"))
 
 
 def test_prune_reports_removes_old_files(tmp_path) -> None:
@@ -78,3 +90,35 @@ def test_write_report_sanitizes_machine_name(tmp_path) -> None:
     timestamped, latest = write_report(tmp_path, report)
     assert "Studio-A" in timestamped.name
     assert "Studio-A" in latest.name
+
+
+def test_prune_reports_removes_old_archived_files(tmp_path) -> None:
+    reports_dir = tmp_path / "reports"
+    archive_dir = reports_dir / "old scans"
+    archive_dir.mkdir(parents=True)
+    old_report = archive_dir / "Studio__20000101-000000.json"
+    old_report.write_text("{}", encoding="utf-8")
+    latest = reports_dir / "Studio__latest.json"
+    latest.write_text("{}", encoding="utf-8")
+    old_timestamp = 946684800  # 2000-01-01
+    os.utime(old_report, (old_timestamp, old_timestamp))
+    os.utime(latest, (old_timestamp, old_timestamp))
+    prune_reports(reports_dir, prune_days=1)
+    assert not old_report.exists()
+    assert latest.exists()
+
+
+def test_replace_with_link_copies_when_linking_fails(tmp_path, monkeypatch) -> None:
+    from pt_plugin_sync import reporting as reporting_module
+
+    source = tmp_path / "updates__Studio__20240101-000000.html"
+    source.write_bytes(b"<html></html>")
+    target = tmp_path / "updates__Studio__latest.html"
+
+    def fail_link(*_args):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(reporting_module.os, "link", fail_link)
+    reporting_module._replace_with_link(target, source)
+    assert target.read_bytes() == b"<html></html>"
+    assert not list(tmp_path.glob(".*.tmp"))
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import fcntl
 import pathlib
+import threading
+import time
+
+import pytest
 
 from pt_plugin_sync.config import Config
 from pt_plugin_sync.combined_report import (
@@ -16,7 +21,7 @@ def _fixtures_path() -> pathlib.Path:
     return pathlib.Path(__file__).parent / "fixtures" / "plugins"
 
 
-def test_perform_scan_writes_reports(tmp_path) -> None:
+def test_perform_scan_writes_reports(temp_config_dir, tmp_path) -> None:
     reports_dir = tmp_path / "reports"
     reports_dir.mkdir()
     config = Config(
@@ -36,7 +41,7 @@ def test_perform_scan_writes_reports(tmp_path) -> None:
     assert (reports_dir / COMBINED_JSON_LATEST_FILENAME).exists()
 
 
-def test_perform_scan_update_count(tmp_path) -> None:
+def test_perform_scan_update_count(temp_config_dir, tmp_path) -> None:
     reports_dir = tmp_path / "reports"
     reports_dir.mkdir()
     config = Config(
@@ -49,15 +54,103 @@ def test_perform_scan_update_count(tmp_path) -> None:
     assert result.update_count >= 0
 
 
-def test_count_updates_filters_invalid_entries() -> None:
+def test_count_updates_counts_machine_updates() -> None:
     summary = {
         "updates_by_machine": {
-            "Studio": ["bad", {"key": "ok"}, 123],
+            "Studio": [{"key": "a"}, {"key": "b"}],
+            "Laptop": "bad",
         }
     }
-    count = scan_cycle_module._count_updates(summary, "Studio")
-    assert count == 1
+    assert scan_cycle_module._count_updates(summary, "Studio") == 2
+    assert scan_cycle_module._count_updates(summary, "Laptop") == 0
+    assert scan_cycle_module._count_updates(summary, "Missing") == 0
 
 
 def test_count_updates_handles_missing_summary() -> None:
     assert scan_cycle_module._count_updates(None, "Studio") == 0
+
+
+def test_perform_scan_waits_for_running_scan(temp_config_dir, tmp_path) -> None:
+    reports_dir = tmp_path / "reports"
+    reports_dir.mkdir()
+    config = Config(
+        machine_name="Studio",
+        plugins_path=str(_fixtures_path()),
+        reports_path=str(reports_dir),
+        reports_backend="local",
+    )
+    results = []
+    lock_path = temp_config_dir[0] / scan_cycle_module.SCAN_LOCK_FILENAME
+    with lock_path.open("w") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        worker = threading.Thread(
+            target=lambda: results.append(perform_scan(config, open_report=False))
+        )
+        worker.start()
+        worker.join(timeout=0.2)
+        assert worker.is_alive()
+        assert results == []
+        fcntl.flock(handle, fcntl.LOCK_UN)
+    worker.join(timeout=10)
+    assert not worker.is_alive()
+    assert results[0].summary is not None
+    assert (reports_dir / "Studio__latest.json").exists()
+    assert not (reports_dir / scan_cycle_module.SCAN_LOCK_FILENAME).exists()
+
+
+def test_perform_scan_coalesces_concurrent_requests(temp_config_dir, monkeypatch) -> None:
+    release = threading.Event()
+    started = threading.Event()
+    calls = []
+
+    def fake_scan_locked(_config, *, open_report):
+        calls.append(open_report)
+        started.set()
+        release.wait(timeout=10)
+        return scan_cycle_module.ScanResult(
+            diff=None, summary={"run": len(calls)}, update_count=len(calls), report_path=None
+        )
+
+    monkeypatch.setattr(scan_cycle_module, "_perform_scan_locked", fake_scan_locked)
+    config = Config(machine_name="Studio", plugins_path="", reports_path="")
+    results = []
+
+    def scan():
+        results.append(perform_scan(config, open_report=False))
+
+    first = threading.Thread(target=scan)
+    first.start()
+    assert started.wait(timeout=10)
+    followers = [threading.Thread(target=scan) for _ in range(3)]
+    for follower in followers:
+        follower.start()
+    deadline = time.monotonic() + 10
+    while len(scan_cycle_module._SCAN_STATE._waiters) < len(followers):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    release.set()
+    for worker in [first, *followers]:
+        worker.join(timeout=10)
+        assert not worker.is_alive()
+    assert len(calls) == 2
+    assert len(results) == 4
+    assert all(result.summary is not None for result in results)
+    assert sorted(result.update_count for result in results) == [1, 2, 2, 2]
+
+
+def test_perform_scan_gives_up_when_another_process_holds_lock(
+    temp_config_dir, monkeypatch
+) -> None:
+    def fail_scan(*_args, **_kwargs):
+        raise AssertionError("scan should not run while another process holds the lock")
+
+    monkeypatch.setattr(scan_cycle_module, "_perform_scan_locked", fail_scan)
+    monkeypatch.setattr(scan_cycle_module, "SCAN_LOCK_TIMEOUT_SECONDS", 0.1)
+    monkeypatch.setattr(scan_cycle_module, "_SCAN_LOCK_POLL_SECONDS", 0.01)
+    config = Config(machine_name="Studio", plugins_path="", reports_path="")
+    lock_path = temp_config_dir[0] / scan_cycle_module.SCAN_LOCK_FILENAME
+    with lock_path.open("w") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        with pytest.raises(scan_cycle_module.ScanInProgressError):
+            perform_scan(config, open_report=False)
+    assert scan_cycle_module._RUNNING_SCAN is None
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import pathlib
+import plistlib
 
+from pt_plugin_sync import scanner as scanner_module
 from pt_plugin_sync.scanner import scan_plugins
 
 
@@ -68,3 +70,116 @@ def test_scan_plugins_raises_permission_error(monkeypatch, tmp_path) -> None:
         assert "Permission denied" in str(exc)
     else:
         raise AssertionError("Expected PermissionError")
+
+
+def test_scan_plugins_rehashes_only_changed_binaries(monkeypatch, tmp_path) -> None:
+    macos_dir = tmp_path / "plugins" / "Delta.aaxplugin" / "Contents" / "MacOS"
+    macos_dir.mkdir(parents=True)
+    binary = macos_dir / "Delta"
+    binary.write_bytes(b"first")
+    monkeypatch.setattr(scanner_module, "_DIGEST_CACHE", {})
+    first = scan_plugins(tmp_path / "plugins", hash_binaries=True)[0].binary_hash
+
+    def fail_digest(*_args, **_kwargs):
+        raise AssertionError("unchanged binary should not be rehashed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(scanner_module, "_sha256_file", fail_digest)
+        assert scan_plugins(tmp_path / "plugins", hash_binaries=True)[0].binary_hash == first
+
+    binary.write_bytes(b"second!")
+    assert scan_plugins(tmp_path / "plugins", hash_binaries=True)[0].binary_hash != first
+
+
+def test_read_info_plist_handles_nested_and_binary_plists(tmp_path) -> None:
+    xml_bundle = tmp_path / "Xml.aaxplugin"
+    (xml_bundle / "Contents").mkdir(parents=True)
+    (xml_bundle / "Contents" / "Info.plist").write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+<plist version="1.0">
+<dict>
+  <key>Nested</key>
+  <dict><key>CFBundleVersion</key><string>nested</string></dict>
+  <key>CFBundleIdentifier</key>
+  <string>com.example.a&amp;b</string>
+  <key>CFBundleVersion</key>
+  <string>42</string>
+</dict>
+</plist>
+""",
+        encoding="utf-8",
+    )
+    info = scanner_module._read_info_plist(xml_bundle)
+    assert info["CFBundleIdentifier"] == "com.example.a&b"
+    assert info["CFBundleVersion"] == "42"
+
+    binary_bundle = tmp_path / "Binary.aaxplugin"
+    (binary_bundle / "Contents").mkdir(parents=True)
+    (binary_bundle / "Contents" / "Info.plist").write_bytes(
+        plistlib.dumps({"CFBundleIdentifier": "com.example.bin"}, fmt=plistlib.FMT_BINARY)
+    )
+    assert scanner_module._read_info_plist(binary_bundle)["CFBundleIdentifier"] == "com.example.bin"
+
+
+def test_scan_info_keys_defers_when_layout_is_unusual() -> None:
+    simple = b"<plist><dict><key>CFBundleVersion</key>\n  <string>7</string></dict></plist>"
+    assert scanner_module._scan_info_keys(simple) == {"CFBundleVersion": "7"}
+    cdata = b"<plist><dict><key>CFBundleVersion</key><string><![CDATA[7]]></string></dict></plist>"
+    assert scanner_module._scan_info_keys(cdata) is None
+    escaped = b"<plist><dict><key>CFBundleIdentifier</key><string>a&amp;b</string></dict></plist>"
+    assert scanner_module._scan_info_keys(escaped) is None
+
+
+def test_read_info_plist_reuses_parse_until_plist_changes(monkeypatch, tmp_path) -> None:
+    bundle = tmp_path / "Delta.aaxplugin"
+    (bundle / "Contents").mkdir(parents=True)
+    plist_path = bundle / "Contents" / "Info.plist"
+    plist_path.write_bytes(plistlib.dumps({"CFBundleVersion": "1"}))
+    monkeypatch.setattr(scanner_module, "_INFO_CACHE", {})
+    assert scanner_module._read_info_plist(bundle)["CFBundleVersion"] == "1"
+
+    def fail_load(_data):
+        raise AssertionError("unchanged plist should not be parsed again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(scanner_module, "_load_info_plist", fail_load)
+        assert scanner_module._read_info_plist(bundle)["CFBundleVersion"] == "1"
+
+    plist_path.write_bytes(plistlib.dumps({"CFBundleVersion": "22"}))
+    assert scanner_module._read_info_plist(bundle)["CFBundleVersion"] == "22"
+
+
+def test_plugin_info_precomputes_key_and_version() -> None:
+    plugin = scanner_module.PluginInfo(
+        bundle_name="Alpha.aaxplugin",
+        bundle_id=None,
+        short_version="1.0",
+        bundle_version=None,
+        mtime=1.0,
+    )
+    assert scanner_module.plugin_key(plugin) == "Alpha.aaxplugin"
+    assert scanner_module.plugin_version_tuple(plugin) == ("1.0", "unknown")
+    assert not hasattr(plugin, "__dict__")
+
+
+def test_hash_bundle_binaries_skips_symlinks_and_empty_files(monkeypatch, tmp_path) -> None:
+    bundle = tmp_path / "Delta.aaxplugin"
+    macos_dir = bundle / "Contents" / "MacOS"
+    macos_dir.mkdir(parents=True)
+    (macos_dir / "Delta").write_bytes(b"binary")
+    baseline = scanner_module._hash_bundle_binaries(bundle)
+    (macos_dir / "Link").symlink_to(macos_dir / "Delta")
+    assert scanner_module._hash_bundle_binaries(bundle) == baseline
+
+    opened = []
+    real_sha256_file = scanner_module._sha256_file
+
+    def tracking_sha256_file(path):
+        opened.append(path)
+        return real_sha256_file(path)
+
+    monkeypatch.setattr(scanner_module, "_sha256_file", tracking_sha256_file)
+    monkeypatch.setattr(scanner_module, "_DIGEST_CACHE", {})
+    (macos_dir / "Empty").write_bytes(b"")
+    assert scanner_module._hash_bundle_binaries(bundle) != baseline
+    assert opened == [str(macos_dir / "Delta")]
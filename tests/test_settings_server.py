@@ -53,6 +53,7 @@ def test_settings_save_updates_config_and_server_state(temp_config_dir, tmp_path
     server = SettingsServer(config, saved.append)
     url = server.start()
     try:
+        assert str(plugins_dir) in _get(url, "/")
         new_plugins_dir = tmp_path / "plugins-next"
         new_plugins_dir.mkdir()
         status = _post_form(
@@ -70,6 +71,9 @@ def test_settings_save_updates_config_and_server_state(temp_config_dir, tmp_path
         )
         assert status == 303
         assert server._config.plugins_path == str(new_plugins_dir)
+        assert "Settings saved." in _get(url, "/")
+        assert str(new_plugins_dir) in _get(url, "/")
+        assert server._form_cache is not None
         loaded = load_config()
         assert loaded is not None
         assert loaded.plugins_path == str(new_plugins_dir)
@@ -436,3 +440,214 @@ def test_extract_multipart_file_rejects_wrong_content_type() -> None:
         assert "Expected multipart/form-data" in str(exc)
     else:
         raise AssertionError("Expected ValueError for invalid content-type")
+
+
+def test_esc_matches_html_escape() -> None:
+    import html
+
+    from pt_plugin_sync.settings_server import _esc
+
+    sample = "<a href=\"x\">Tom & Jerry's</a>"
+    assert _esc(sample) == html.escape(sample, quote=True)
+
+
+def test_slow_dropbox_auth_does_not_block_form(temp_config_dir, tmp_path, monkeypatch) -> None:
+    import threading
+
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir()
+    reports_dir = tmp_path / "reports"
+    reports_dir.mkdir()
+    config = Config(
+        machine_name="Studio",
+        plugins_path=str(plugins_dir),
+        reports_path=str(reports_dir),
+        reports_backend="dropbox",
+        dropbox_app_key="key",
+        dropbox_app_secret="secret",
+    )
+    release = threading.Event()
+
+    def slow_authorize_url(*_args) -> str:
+        release.wait(5)
+        return "http://example.com"
+
+    monkeypatch.setattr(settings_server_module, "_dropbox_authorize_url", slow_authorize_url)
+    server = SettingsServer(config, lambda _cfg: None)
+    url = server.start()
+    auth_bodies: list[str] = []
+    auth = threading.Thread(target=lambda: auth_bodies.append(_get(url, "/dropbox-auth-start")))
+    auth.start()
+    try:
+        assert "Pro Tools Plugin Sync" in _get(url, "/")
+        assert not release.is_set()
+    finally:
+        release.set()
+        auth.join(5)
+        server.stop()
+    assert auth_bodies and "http://example.com" in auth_bodies[0]
+
+
+def test_extract_multipart_file_returns_named_field() -> None:
+    from pt_plugin_sync.settings_server import _extract_multipart_file
+
+    boundary = "----boundary"
+    content_type = f'multipart/form-data; boundary="{boundary}"'
+    body = (
+        f"--{boundary}\r\n"
+        "Content-Disposition: form-data; name=\"other\"; filename=\"config_file\"\r\n\r\n"
+        "skip\r\n"
+        f"--{boundary}\r\n"
+        "Content-Disposition: form-data; name=\"config_file\"; filename=\"config.toml\"\r\n"
+        "Content-Type: text/plain\r\n\r\n"
+        "machine_name = \"Studio\"\r\n"
+        f"--{boundary}--\r\n"
+    ).encode("utf-8")
+    assert _extract_multipart_file(body, content_type, "config_file") == (
+        b'machine_name = "Studio"'
+    )
+
+
+def test_post_rejects_oversized_body(temp_config_dir, tmp_path) -> None:
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir()
+    reports_dir = tmp_path / "reports"
+    reports_dir.mkdir()
+    config = Config(
+        machine_name="Studio",
+        plugins_path=str(plugins_dir),
+        reports_path=str(reports_dir),
+        reports_backend="local",
+    )
+    server = SettingsServer(config, lambda _cfg: None)
+    url = server.start()
+    try:
+        parsed = urllib.parse.urlparse(url)
+        conn = http.client.HTTPConnection(parsed.hostname, parsed.port)
+        conn.putrequest("POST", "/save")
+        conn.putheader("Content-Type", "application/x-www-form-urlencoded")
+        conn.putheader("Content-Length", str(settings_server_module._MAX_BODY_BYTES + 1))
+        conn.endheaders()
+        response = conn.getresponse()
+        response.read()
+        conn.close()
+        assert response.status == 413
+        assert server._config == config
+    finally:
+        server.stop()
+
+
+def test_dropbox_flow_class_is_resolved_once() -> None:
+    from dropbox import DropboxOAuth2FlowNoRedirect
+
+    flow_class = settings_server_module._dropbox_flow_class
+    assert flow_class() is DropboxOAuth2FlowNoRedirect
+    assert flow_class() is DropboxOAuth2FlowNoRedirect
+    assert flow_class.cache_info().misses <= 1
+
+
+def test_config_from_form_uses_defaults_and_rejects_non_numbers() -> None:
+    from pt_plugin_sync.config import default_config
+    from pt_plugin_sync.settings_server import _config_from_form
+
+    current = default_config("Studio")
+    updated = _config_from_form({"machine_name": [" Desk "]}, current)
+    assert updated.machine_name == "Desk"
+    assert updated.scan_interval_seconds == current.scan_interval_seconds
+    try:
+        _config_from_form({"prune_days": ["soon"]}, current)
+    except ValueError as exc:
+        assert "prune_days must be a number" in str(exc)
+    else:
+        raise AssertionError("Expected ValueError for non-numeric prune_days")
+
+
+def test_read_form_values_matches_parse_qs() -> None:
+    import io
+
+    body = urllib.parse.urlencode(
+        [
+            ("machine_name", "Studio A&B"),
+            ("plugins_path", "/Library/Café Plug-Ins"),
+            ("dropbox_app_key", ""),
+            ("hash_binaries", "on"),
+            ("hash_binaries", "again"),
+        ]
+    ).encode("utf-8")
+
+    class FakeHandler:
+        headers = {"Content-Length": str(len(body))}
+        rfile = io.BytesIO(body)
+
+    values = settings_server_module._read_form_values(FakeHandler())
+    assert values == urllib.parse.parse_qs(body.decode("utf-8"))
+
+
+def test_get_form_returns_html_headers(temp_config_dir, tmp_path) -> None:
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir()
+    config = Config(
+        machine_name="Studio",
+        plugins_path=str(plugins_dir),
+        reports_path=str(tmp_path / "reports"),
+        reports_backend="local",
+    )
+    server = SettingsServer(config, lambda _cfg: None)
+    url = server.start()
+    try:
+        parsed = urllib.parse.urlparse(url)
+        conn = http.client.HTTPConnection(parsed.hostname, parsed.port)
+        conn.request("GET", "/")
+        response = conn.getresponse()
+        body = response.read()
+        conn.close()
+        assert response.status == 200
+        assert response.getheader("Content-Type") == "text/html; charset=utf-8"
+        assert int(response.getheader("Content-Length")) == len(body)
+    finally:
+        server.stop()
+
+
+def test_parse_toml_bytes_reuses_identical_uploads(monkeypatch) -> None:
+    calls: list[str] = []
+    real_loads = settings_server_module.tomllib.loads
+
+    def counting_loads(text: str) -> dict:
+        calls.append(text)
+        return real_loads(text)
+
+    settings_server_module._parse_toml_bytes.cache_clear()
+    monkeypatch.setattr(settings_server_module.tomllib, "loads", counting_loads)
+    data = b'machine_name = "Studio"\n'
+    first = settings_server_module._parse_toml_bytes(data)
+    second = settings_server_module._parse_toml_bytes(bytes(data))
+    assert first == second == {"machine_name": "Studio"}
+    assert len(calls) == 1
+
+
+def test_start_skips_reverse_dns(temp_config_dir, tmp_path, monkeypatch) -> None:
+    import socket
+
+    def fail_getfqdn(*_args):
+        raise AssertionError("settings server should not resolve its own hostname")
+
+    monkeypatch.setattr(socket, "getfqdn", fail_getfqdn)
+    config = Config(
+        machine_name="Studio",
+        plugins_path=str(tmp_path / "plugins"),
+        reports_path=str(tmp_path / "reports"),
+        reports_backend="local",
+    )
+    server = SettingsServer(config, lambda _cfg: None)
+    url = server.start()
+    try:
+        assert url.startswith("http://127.0.0.1:")
+        parsed = urllib.parse.urlparse(url)
+        conn = http.client.HTTPConnection(parsed.hostname, parsed.port)
+        conn.request("GET", "/favicon.ico")
+        response = conn.getresponse()
+        response.read()
+        conn.close()
+        assert response.status == 404
+    finally:
+        server.stop()
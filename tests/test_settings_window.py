@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import importlib
 import sys
 import types
@@ -36,6 +37,7 @@ def _install_fake_pyobjc(monkeypatch):
     )
     pyobjc_tools = types.SimpleNamespace(AppHelper=types.SimpleNamespace(callAfter=lambda fn: fn()))
     objc = types.SimpleNamespace(
+        autorelease_pool=contextlib.nullcontext,
         python_method=lambda fn: fn,
         super=lambda cls, self: self,
     )
@@ -57,3 +59,32 @@ def test_settings_window_debug_state(monkeypatch, tmp_path) -> None:
     settings_window = importlib.reload(settings_window)
     controller = settings_window.SettingsWindowController().initWithOnSave_(lambda _cfg: None)
     assert controller.debug_state() == "window=None"
+
+
+def test_settings_window_populate_only_sets_changed_widgets(monkeypatch) -> None:
+    from dataclasses import replace
+
+    from pt_plugin_sync.config import default_config
+
+    _install_fake_pyobjc(monkeypatch)
+    if "pt_plugin_sync.settings_window" in sys.modules:
+        del sys.modules["pt_plugin_sync.settings_window"]
+    import pt_plugin_sync.settings_window as settings_window
+
+    settings_window = importlib.reload(settings_window)
+    controller = settings_window.SettingsWindowController().initWithOnSave_(lambda _cfg: None)
+    calls: list[str] = []
+    monkeypatch.setattr(controller, "_set_field", lambda key, _value: calls.append(key), raising=False)
+    monkeypatch.setattr(controller, "_set_checkbox", lambda key, _value: calls.append(key), raising=False)
+    monkeypatch.setattr(controller, "_set_backend", lambda _value: calls.append("backend"), raising=False)
+    controller._checkboxes = {"hash_binaries": None, "auto_update_download": None}
+
+    config = default_config("Studio")
+    controller._config = config
+    controller._populate()
+    assert len(calls) == 13
+
+    calls.clear()
+    controller._config = replace(config, machine_name="Laptop", hash_binaries=True)
+    controller._populate()
+    assert calls == ["machine_name", "hash_binaries"]
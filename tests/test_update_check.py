@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import json
+import urllib.error
+
+import pytest
 
 from pt_plugin_sync import update_check as update_check_module
 from pt_plugin_sync.update_check import is_update_available, latest_release
 
 
+@pytest.fixture(autouse=True)
+def _isolated_release_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(update_check_module, "RELEASE_CACHE_PATH", tmp_path / "release.json")
+    monkeypatch.setattr(update_check_module, "_RELEASE_CACHE", None)
+
+
 def test_parse_version() -> None:
     assert update_check_module._parse_version("v1.2.3") == (1, 2, 3)
     assert update_check_module._parse_version("version 0.0.1") == (0, 0, 1)
@@ -31,6 +40,8 @@ def test_latest_release_parses_payload(monkeypatch) -> None:
     }
 
     class FakeResponse:
+        headers: dict = {}
+
         def __init__(self, data: bytes):
             self._data = data
 
@@ -63,6 +74,8 @@ def test_latest_release_missing_version_returns_none(monkeypatch) -> None:
     payload = {"tag_name": "", "assets": []}
 
     class FakeResponse:
+        headers: dict = {}
+
         def __init__(self, data: bytes):
             self._data = data
 
@@ -86,6 +99,8 @@ def test_latest_release_handles_non_list_assets(monkeypatch) -> None:
     payload = {"tag_name": "v1.0.0", "assets": {"name": "bad"}}
 
     class FakeResponse:
+        headers: dict = {}
+
         def __init__(self, data: bytes):
             self._data = data
 
@@ -107,9 +122,75 @@ def test_latest_release_handles_non_list_assets(monkeypatch) -> None:
     assert release.asset_url is None
 
 
+def test_latest_release_reuses_cached_release_on_not_modified(monkeypatch) -> None:
+    payload = {"tag_name": "v1.4.0", "assets": []}
+    seen_etags = []
+
+    class FakeResponse:
+        headers = {"ETag": '"abc"'}
+
+        def read(self):
+            return json.dumps(payload).encode("utf-8")
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    def fake_urlopen(request, timeout=10):
+        etag = request.get_header("If-none-match")
+        seen_etags.append(etag)
+        if etag:
+            raise urllib.error.HTTPError(request.full_url, 304, "Not Modified", {}, None)
+        return FakeResponse()
+
+    monkeypatch.setattr(update_check_module, "_RELEASE_CACHE", None)
+    monkeypatch.setattr(update_check_module.urllib.request, "urlopen", fake_urlopen)
+    first = latest_release()
+    second = latest_release()
+    assert first is not None
+    assert second is first
+    assert seen_etags == [None, '"abc"']
+
+
 def test_current_version_defaults_when_missing(monkeypatch) -> None:
     def fake_version(_name):
         raise update_check_module.metadata.PackageNotFoundError
 
     monkeypatch.setattr(update_check_module.metadata, "version", fake_version)
     assert update_check_module.current_version() == "0.0.0"
+
+
+def test_latest_release_revalidates_with_etag_from_disk(monkeypatch) -> None:
+    payload = {"tag_name": "v1.5.0", "html_url": "https://example.com/r", "assets": []}
+    seen_etags = []
+
+    class FakeResponse:
+        headers = {"ETag": '"disk"'}
+
+        def read(self):
+            return json.dumps(payload).encode("utf-8")
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    def fake_urlopen(request, timeout=10):
+        etag = request.get_header("If-none-match")
+        seen_etags.append(etag)
+        if etag:
+            raise urllib.error.HTTPError(request.full_url, 304, "Not Modified", {}, None)
+        return FakeResponse()
+
+    monkeypatch.setattr(update_check_module.urllib.request, "urlopen", fake_urlopen)
+    first = latest_release()
+    assert update_check_module.RELEASE_CACHE_PATH.exists()
+
+    monkeypatch.setattr(update_check_module, "_RELEASE_CACHE", None)
+    second = latest_release()
+    assert seen_etags == [None, '"disk"']
+    assert second == first
+    assert second.url == "https://example.com/r"
@@ -138,3 +138,50 @@ def test_open_update_report_if_needed_generates_report(tmp_path, monkeypatch) ->
     result = open_update_report_if_needed(config, summary)
     assert result is not None
     assert opened["path"] == result
+
+
+def test_write_update_report_links_latest_to_timestamped(tmp_path) -> None:
+    summary = {
+        "generated_at": "2024-01-01T00:00:00Z",
+        "updates_by_machine": {"Studio": [{"key": "alpha", "reason": "missing"}]},
+    }
+    latest = update_report_module.write_update_report(tmp_path, summary, "Studio")
+    timestamped = [
+        path for path in tmp_path.glob("updates__Studio__*.html") if path != latest
+    ]
+    assert len(timestamped) == 1
+    assert latest.read_bytes() == timestamped[0].read_bytes()
+    assert latest.stat().st_ino == timestamped[0].stat().st_ino
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_open_report_prefers_workspace_opener(tmp_path, monkeypatch) -> None:
+    opened = []
+    monkeypatch.setattr(update_report_module, "_workspace_opener", lambda: opened.append)
+
+    def fail_run(*_args, **_kwargs):
+        raise AssertionError("open should not be spawned when NSWorkspace is available")
+
+    monkeypatch.setattr(update_report_module.subprocess, "run", fail_run)
+    update_report_module._open_report(tmp_path / "report.html")
+    assert opened == [str(tmp_path / "report.html")]
+
+
+def test_has_updates_for_machine_ignores_non_dict_entries() -> None:
+    from pt_plugin_sync.update_report import _has_updates_for_machine
+
+    assert _has_updates_for_machine({"updates_by_machine": {"Studio": ["bad", {"key": "ok"}]}}, "Studio")
+    assert not _has_updates_for_machine({"updates_by_machine": {"Studio": ["bad"]}}, "Studio")
+    assert not _has_updates_for_machine({"updates_by_machine": {"Studio": "bad"}}, "Studio")
+    assert not _has_updates_for_machine({}, "Studio")
+
+
+def test_write_update_report_stamps_filename_and_header_from_one_clock_read(tmp_path) -> None:
+    summary = {"updates_by_machine": {"Studio": [{"key": "alpha", "reason": "missing"}]}}
+    latest = update_report_module.write_update_report(tmp_path, summary, "Studio")
+    assert "generated_at" not in summary
+    timestamped = next(path for path in tmp_path.glob("updates__Studio__*.html") if path != latest)
+    stamp = timestamped.name.split("__")[-1].removesuffix(".html")
+    html = latest.read_text(encoding="utf-8")
+    generated = html.split("Generated: ", 1)[1].split("<", 1)[0]
+    assert generated.replace("-", "").replace(":", "").replace("T", "-").startswith(stamp)